@@ -1,18 +1,71 @@
+from __future__ import annotations
+
 import json
+import random
+import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import wraps
 from typing import Optional
 
+import numpy as np
 import requests
 from requests.adapters import HTTPAdapter, Retry
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+try:
+    from orjson import loads as _json_loads  # Optional: faster parsing of M409 replies
+except ImportError:
+    from json import loads as _json_loads
 
 from science_jubilee.utils.exceptions import JubileeControllerError, JubileeStateError, JubileeConfigurationError, JubileeCommunicationError, JubileeHomingError
 from science_jubilee.utils.logger_utils import setup_logging
 
 logger = setup_logging(logger_name="JubileeController")
 
+_CRASH_MARKER = b"crash detected"
+_ENDSTOP_RE = re.compile(r"\b([A-Z]):\s*([^,\n]*[^,\s])")  # "X: not stopped, Y: at min stop" or one axis per line; state comes out trimmed
+
 ###### LOGS AND ERROR CLASS Not Fully IMPLEMENTED #######
 
+# printf-style templates for the common move shapes; %-formatting beats f-strings with format specs here
+_MOVE_XY = "G0 X%.2f Y%.2f F%.2f"
+_MOVE_XYZ = "G0 X%.2f Y%.2f Z%.2f F%.2f"
+
+def _format_move(x, y, z, u, s, param) -> str:
+    """
+    Build the G0 line for a move, skipping axes that are None.
+    """
+    if x is not None and y is not None and u is None and s is not None and not param:
+        # Fast paths for plain XY and XYZ moves
+        return _MOVE_XY % (x, y, s) if z is None else _MOVE_XYZ % (x, y, z, s)
+    cmd = "G0"
+    if x is not None:
+        cmd += f" X{x:.2f}"
+    if y is not None:
+        cmd += f" Y{y:.2f}"
+    if z is not None:
+        cmd += f" Z{z:.2f}"
+    if u is not None:
+        cmd += f" U{u:.2f}"
+    if s is not None:
+        cmd += f" F{s:.2f}"
+    if param:
+        cmd += f" {param}"
+    return cmd
+
+def _dock_gcode(x_park, y_clear, y_park, z_park, s) -> tuple[str, str, str]:
+    """
+    Build the approach, dock and retract lines of a tool change. Dock and retract only
+    move Y; the retract repeats the feedrate since the lock macro may have changed it.
+    """
+    return (
+        _format_move(x_park, y_clear, z_park, None, s, None),
+        _format_move(None, y_park, None, None, None, None),
+        _format_move(None, y_clear, None, None, s, None),
+    )
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DECORATORS (SAFETY & STATE CHECKS)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -22,37 +75,73 @@ def machine_homed(func):
     Decorator to ensure the machine is homed before executing an action.
     Raises an exception if the machine is not homed. In simulation mode, always passes.
     Only checks X, Y, Z, U axes (first 4 axes).
+    Trusts the cached `axes_homed` state; the machine is only queried when the cache
+    says an axis is not homed (e.g. it was homed from the web interface).
     """
     @wraps(func)
     def homing_check(self, *args, **kwds):
-        if self.simulated:
-            return func(self, *args, **kwds)
-        try:
-            axes_homed = json.loads(self.gcode('M409 K"move.axes[].homed"'))["result"]
-        except Exception as e:
-            logger.error(f"Unable to check homing state: {e}")
-            raise JubileeStateError("Unable to check homing state.") from e
-        if not all(axes_homed[:4]):
-            logger.warning("Attempted to run a machine command before homing X, Y, Z, U.")
-            raise JubileeStateError("Error: The machine must be homed (X, Y, Z, U) before this operation.")
+        if not (self.simulated or all(self.axes_homed[:4])):
+            _require_homed(self)
         return func(self, *args, **kwds)
     return homing_check
 
+def in_order(func):
+    """
+    Decorator serializing a method with the async (*_async) submissions.
+    Once the G-code worker exists, a call from any other thread is queued behind the pending
+    submissions and waited for, so only the worker sends G-code and updates the position,
+    axis-word and positioning-mode caches; commands reach the machine in call order.
+    Calls made on the worker itself, or before any async submission, run directly.
+    """
+    @wraps(func)
+    def run_in_order(self, *args, **kwargs):
+        if self._executor is None or threading.get_ident() == self._worker_ident:
+            return func(self, *args, **kwargs)
+        return self._submit(func, self, *args, **kwargs).result()
+    return run_in_order
+
+def _require_homed(self) -> None:
+    """
+    Re-read the homing state after the cache reported an unhomed axis, and raise if X, Y, Z
+    or U is still not homed.
+    """
+    try:
+        axes_homed = _json_loads(self._query_model("move.axes[].homed"))["result"]
+    except Exception as e:
+        logger.error(f"Unable to check homing state: {e}")
+        raise JubileeStateError("Unable to check homing state.") from e
+    self.axes_homed = list(axes_homed[:4])
+    if not all(axes_homed[:4]):
+        logger.warning("Attempted to run a machine command before homing X, Y, Z, U.")
+        raise JubileeStateError("Error: The machine must be homed (X, Y, Z, U) before this operation.")
+
+def _ask_user(question: str) -> bool:
+    """
+    Default homing confirmation: ask a yes/no question on stdin.
+    Raises:
+        JubileeHomingError: If no user input is available.
+    """
+    try:
+        response = input(f"{question} [y/n] ")
+    except EOFError:
+        logger.error("User input not available for safe_homing.")
+        raise JubileeHomingError("User input not available for safe_homing.")
+    return response.strip().lower() in ["y", "yes"]
+
 def safe_homing(func):
     """
     Decorator to always ask for confirmation before homing.
     If a tool is mounted, asks the user to remove it, then always checks that the deck is clear.
+    Questions go to the callback registered with `set_homing_confirm`, or to stdin by default.
+    Skipped in simulation mode.
     """
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        try:
-            response = input("Is a tool currently mounted? [y/n] ")
-        except EOFError:
-            logger.error("User input not available for safe_homing.")
-            raise JubileeHomingError("User input not available for safe_homing.")
-        if response.lower() in ["y", "yes"]:
-            confirm = input("Are you ready to remove it now? [y/n] ")
-            if confirm.lower() not in ["y", "yes"]:
+        if self.simulated:
+            return func(self, *args, **kwargs)
+        confirm = self._homing_confirm or _ask_user
+        if confirm("Is a tool currently mounted?"):
+            if not confirm("Are you ready to remove it now?"):
                 print("Homing cancelled. Please remove the tool first.")
                 logger.info("Homing cancelled by user (tool not removed).")
                 return
@@ -60,8 +149,7 @@ def safe_homing(func):
                 self.tool_unlock()
                 print("Resuming homing process.")
         # Always check deck clearance, regardless of tool status
-        response = input("Is the deck clear of any obstacles? [y/n] ")
-        if response.lower() not in ["y", "yes"]:
+        if not confirm("Is the deck clear of any obstacles?"):
             print("Please clear the deck before homing the Z axis.")
             logger.info("Homing cancelled by user (deck not clear).")
             return
@@ -85,28 +173,76 @@ class JubileeController:
         simulated (bool): If True, runs in simulation mode (no hardware communication).
         crash_detection (bool): If True, enables crash detection logic.
         crash_handler (Callable): Optional callback for crash events.
-        _absolute_positioning (bool): True if machine is in absolute positioning mode.
-        _configured_axes (list[str] | None): List of configured axes.
-        _axis_limits (list[tuple[float, float]] | None): Axis limits for each axis.
+        poll_interval_min (float): First delay between reply polls on the rr_gcode path, in seconds.
+        poll_interval_max (float): Cap on the delay between reply polls, in seconds.
+        _homing_confirm (Callable | None): Answers the safe_homing questions; stdin prompts if None.
+        _absolute_positioning (bool | None): True if machine is in absolute positioning mode, None if unknown.
+        _configured_axes (tuple[str, ...] | None): Configured axis letters.
+        _axis_limits (tuple[tuple[float, float], ...] | None): Axis limits for each axis.
+        _axis_limits_by_letter (dict[str, tuple[float, float]]): Axis limits keyed by axis letter.
+        _xyz_limits (np.ndarray | None): (3, 2) array of X/Y/Z (min, max) for batched checks.
         axes_homed (list[bool]): Homing status for X, Y, Z, U axes.
+        _position_cache (dict[str, float] | None): Last known position, None once any other G-code is sent.
+        _machine_code_supported (bool | None): Whether /machine/code works on this board, None until probed.
+        _machine_code_requests (dict[bool, requests.PreparedRequest]): Prepared /machine/code POSTs keyed by wait_reply.
         session (requests.Session | None): HTTP session for communication.
-        tool_parking_positions (dict): Default parking positions for tools.
+        _executor (ThreadPoolExecutor | None): Single worker used by the *_async methods.
+        _in_flight (threading.BoundedSemaphore): Bounds the number of pending async submissions.
+        _worker_ident (int | None): Thread identifier of the G-code worker, None until it starts.
+        tool_parking_positions (dict): Default parking positions for tools. Change them with set_tool_parking_positions().
+        _parking_tuples (dict[int, tuple[float, float, float, float]]): (x_park, y_clear, y_park, z_park) per tool.
+        _park_array (np.ndarray): The same values as a (num_tools, 4) array, for planning many tool changes at once.
+        _park_rows (dict[int, int]): Row of each tool index in _park_array.
+        _park_gcode (dict[int, tuple[str, str, str]]): Approach, dock and retract G0 lines per tool at the default Z and speed.
     """
 
+    # Every move reads the mode, limits and axis-state attributes below; slots keep those lookups
+    # off the instance dict and turn a misspelled attribute into an AttributeError
+    __slots__ = (
+        "ser", "port", "baudrate", "address", "simulated", "crash_detection", "crash_handler",
+        "poll_interval_min", "poll_interval_max", "session", "_executor", "_in_flight", "_worker_ident", "_homing_confirm",
+        "_absolute_positioning", "_configured_axes", "_axis_limits", "_axis_limits_by_letter", "_xyz_limits",
+        "axes_homed", "_position_cache", "_machine_code_supported", "_machine_code_requests",
+        "_active_tool_index", "_tool_z_offsets", "tool_parking_positions", "_parking_tuples", "_park_array", "_park_rows", "_park_gcode",
+    )
+
     LOCALHOST: str = "192.168.1.2"
-    ser: None = None
+    MAX_IN_FLIGHT: int = 8
+    _sessions: dict = {}  # Pooled HTTP sessions shared by all controllers, keyed by address
+    _sessions_lock = threading.Lock()
+
+    # Tool-change macro commands, built once for the four tool slots
+    _TOOL_LOCK_CMD: str = 'M98 P"0:/macros/tool_manager/tool_lock.g"'
+    _TOOL_UNLOCK_CMD: str = 'M98 P"0:/macros/tool_manager/tool_unlock.g"'
+    _PICKUP_CMDS: tuple = tuple(f'M98 P"0:/macros/tool_manager/pickup_tool/pickup_tool{i}.g"' for i in range(4))
+    _PARK_CMDS: tuple = tuple(f'M98 P"0:/macros/tool_manager/park_tool/park_tool{i}.g"' for i in range(4))
+    _VALID_TOOL_INDICES: frozenset = frozenset(range(4))
+
+    ser: None
     port: Optional[str]
     baudrate: int
     address: str
     simulated: bool
     crash_detection: bool
     crash_handler: Optional[callable]
-    _absolute_positioning: bool
-    _configured_axes: Optional[list[str]]
-    _axis_limits: Optional[list[tuple[float, float]]]
+    poll_interval_min: float
+    poll_interval_max: float
+    _homing_confirm: Optional[callable]
+    _absolute_positioning: Optional[bool]
+    _configured_axes: Optional[tuple[str, ...]]
+    _axis_limits: Optional[tuple[tuple[float, float], ...]]
+    _axis_limits_by_letter: dict[str, tuple[float, float]]
+    _xyz_limits: Optional[np.ndarray]
     axes_homed: list[bool]
+    _position_cache: Optional[dict[str, float]]
+    _machine_code_supported: Optional[bool]
+    _machine_code_requests: dict[bool, requests.PreparedRequest]
     session: Optional[requests.Session]
     tool_parking_positions: dict
+    _parking_tuples: dict[int, tuple[float, float, float, float]]
+    _park_array: np.ndarray
+    _park_rows: dict[int, int]
+    _park_gcode: dict[int, tuple[str, str, str]]
 
     def __init__(
         self,
@@ -116,6 +252,8 @@ class JubileeController:
         simulated: bool = False,
         crash_detection: bool = False,
         crash_handler: callable = None,
+        poll_interval_min: float = 0.02,
+        poll_interval_max: float = 0.5,
     ) -> None:
         """
         Initialize the JubileeController.
@@ -127,6 +265,8 @@ class JubileeController:
             simulated (bool, optional): If True, G-code commands are printed instead of sent.
             crash_detection (bool, optional): If True, detects and handles tool crash events.
             crash_handler (callable, optional): Callback to invoke on crash.
+            poll_interval_min (float, optional): First delay between reply polls (default: 0.02 s).
+            poll_interval_max (float, optional): Cap on the delay between reply polls (default: 0.5 s).
         Raises:
             JubileeControllerError: If connection or initialization fails.
         """
@@ -139,14 +279,25 @@ class JubileeController:
         self.simulated = simulated
 
         self.session = None  # HTTP session for communication, None if simulated
+        self._executor = None  # Created on first async submission
+        self._in_flight = threading.BoundedSemaphore(self.MAX_IN_FLIGHT)
+        self._worker_ident = None
 
         self.crash_detection = crash_detection
         self.crash_handler = crash_handler
+        self.poll_interval_min = poll_interval_min
+        self.poll_interval_max = poll_interval_max
+        self._homing_confirm = None
 
-        self._absolute_positioning = True
+        self._absolute_positioning = None  # Unknown until G90/G91 is sent
         self._configured_axes = None
         self._axis_limits = None
+        self._axis_limits_by_letter = {}
+        self._xyz_limits = None
         self.axes_homed = [False] * 4  # Default: X/Y/Z/U axes
+        self._position_cache = None
+        self._machine_code_supported = None
+        self._machine_code_requests = {}
         
         if self.address != self.LOCALHOST:
             logger.warning("Disconnecting this application from the network will halt connection to Jubilee.")
@@ -156,19 +307,18 @@ class JubileeController:
         if not self.simulated:
             try:
                 self.connect()
-                self._set_absolute_positioning()
             except Exception as e:
                 logger.error(f"Failed to connect or initialize Jubilee machine: {e}")
                 raise JubileeControllerError("Initialization failed.") from e
         else:
             logger.info("Running in simulation mode. No connection established.")
 
-        self.tool_parking_positions = {
+        self.set_tool_parking_positions({
             0: {"x_park": 277.0, "y_clear": 280.0, "y_park": 342.0, "z_park": 150.0},
             1: {"x_park": 191.0, "y_clear": 280.0, "y_park": 342.0, "z_park": 150.0},
             2: {"x_park": 105.0, "y_clear": 280.0, "y_park": 342.0, "z_park": 150.0},
             3: {"x_park": 19.0, "y_clear": 280.0, "y_park": 342.0, "z_park": 150.0},
-        }
+        })
 
     def connect(self) -> None:
         """
@@ -180,8 +330,9 @@ class JubileeController:
         if self.simulated:
             logger.info("(SIMULATED) connect() called. Setting dummy state.")
             self.axes_homed = [True, True, True, True]
-            self._configured_axes = ["X", "Y", "Z", "U"]
-            self._axis_limits = [(0, 300), (0, 300), (0, 300), (0, 200)]
+            self._configured_axes = ("X", "Y", "Z", "U")
+            self._axis_limits = ((0, 300), (0, 300), (0, 300), (0, 200))
+            self._axis_limits_by_letter = dict(zip(self._configured_axes, self._axis_limits))
             self._active_tool_index = None
             self._tool_z_offsets = None
             return
@@ -191,11 +342,9 @@ class JubileeController:
         try:
             logger.info("Connecting to Jubilee machine...")
             self.session = self._create_requests_session()  # Ensure session is (re)created
-            self.axes_homed = self._retry_json(lambda: self.gcode("M409 K\"move.axes[].homed\""))["result"][:4]
+            self.axes_homed = self._retry_json(lambda: self._query_model("move.axes[].homed"))["result"][:4]
             self._active_tool_index = None
             self._tool_z_offsets = None
-            self._configured_axes = self.get_configured_axes()
-            self._axis_limits = self.get_axis_limits()
             self._set_absolute_positioning()
             logger.info("Successfully connected and initialized Jubilee machine.")
         except Exception as e:
@@ -204,9 +353,11 @@ class JubileeController:
 
     def disconnect(self) -> None:
         """
-        Close the connection. For HTTP, closes the requests session if open.
+        Close the connection. For HTTP, releases the shared requests session; its pooled
+        connections stay open for the next connect() (see `close_sessions`).
         In simulation mode, just logs.
         """
+        self._shutdown_executor()
         if self.simulated:
             logger.info("(SIMULATED) disconnect() called.")
             return
@@ -214,14 +365,24 @@ class JubileeController:
             logger.info("Already disconnected. Skipping disconnect().")
             return
         logger.info("Disconnecting from Jubilee machine.")
-        try:
-            self.session.close()
-            logger.info("HTTP session closed.")
-        except Exception as e:
-            logger.warning(f"Failed to close HTTP session: {e}")
         self.session = None
+        self._machine_code_requests = {}
         return
 
+    @classmethod
+    def close_sessions(cls) -> None:
+        """
+        Close every shared HTTP session and its pooled connections.
+        """
+        with cls._sessions_lock:
+            for address, session in cls._sessions.items():
+                try:
+                    session.close()
+                    logger.info(f"HTTP session for {address} closed.")
+                except Exception as e:
+                    logger.warning(f"Failed to close HTTP session for {address}: {e}")
+            cls._sessions.clear()
+
     def reset(self) -> None:
         """
         Issue a software reset.
@@ -239,22 +400,61 @@ class JubileeController:
             logger.info("Issuing software reset (M999)...")
             self.gcode("M999")  # Issue a board reset. Assumes we are already connected
             self.axes_homed = [False] * 4
+            self._absolute_positioning = None
+            self.invalidate_axis_cache()
             self.disconnect()
             logger.info("Reconnecting after reset...")
-            for retries in range(15):
-                time.sleep(2)  # Wait 2 seconds before retrying
+            delay = 0.2
+            deadline = time.time() + 30
+            attempt = 0
+            while time.time() < deadline:
+                time.sleep(delay + random.uniform(0, 0.1))  # Back off while the board reboots
+                delay = min(delay * 1.5, 2.0)
+                attempt += 1
                 try:
                     self.connect()
                     logger.info("Reconnected successfully after reset.")
                     return
-                except JubileeStateError as e:
-                    logger.warning(f"Reconnect attempt {retries+1} failed: {e}")
+                except (JubileeStateError, JubileeCommunicationError) as e:
+                    self.disconnect()  # Drop the half-open session so the next connect() retries
+                    logger.warning(f"Reconnect attempt {attempt} failed: {e}")
             logger.error("Reconnecting failed after reset.")
             raise JubileeStateError("Reconnecting failed.")
         except Exception as e:
             logger.error(f"Reset failed: {e}")
             raise JubileeStateError("Reset failed.") from e
 
+    def set_tool_parking_positions(self, positions: dict) -> None:
+        """
+        Set the tool parking positions and rebuild the lookup tables derived from them.
+        Args:
+            positions (dict): Maps tool index to a dict with "x_park", "y_clear", "y_park" and "z_park".
+        Raises:
+            JubileeConfigurationError: If a position is missing one of the keys.
+        """
+        parking_tuples = {}
+        for index, pos in positions.items():
+            try:
+                parking_tuples[index] = (pos["x_park"], pos["y_clear"], pos["y_park"], pos["z_park"])
+            except KeyError as e:
+                logger.error(f"Parking position for tool {index} is missing {e}.")
+                raise JubileeConfigurationError(f"Parking position for tool {index} is missing {e}.") from e
+        self.tool_parking_positions = positions
+        self._parking_tuples = parking_tuples
+        self._park_rows = {index: row for row, index in enumerate(parking_tuples)}
+        self._park_array = np.array(list(parking_tuples.values()), dtype=float).reshape(-1, 4)
+        # Approach/dock/retract moves at the default park height and speed, formatted once
+        self._park_gcode = {t: _dock_gcode(x, y_clear, y_park, z, 6000) for t, (x, y_clear, y_park, z) in parking_tuples.items()}
+
+    def set_homing_confirm(self, callback: Optional[callable]) -> None:
+        """
+        Register the callback that answers the safe_homing questions, for unattended runs.
+        Args:
+            callback (callable | None): Called with the question text, returns True for "yes".
+                None restores the interactive stdin prompts.
+        """
+        self._homing_confirm = callback
+
     def __enter__(self) -> "JubileeController":
         """
         Enter context manager for JubileeController.
@@ -276,7 +476,9 @@ class JubileeController:
     # ═══════════════════════════════════════════════════════════════════════════
     def _create_requests_session(self) -> Optional[requests.Session]:
         """
-        Create and configure a requests session with retry logic.
+        Return the pooled keep-alive requests session for this controller's address.
+        The Duet web server only speaks HTTP/1.1, so commands and reply polls are
+        serialised on the kept-alive socket rather than multiplexed.
         In simulation mode, returns None.
         Returns:
             Optional[requests.Session]: Configured session or None if simulated.
@@ -287,19 +489,50 @@ class JubileeController:
             logger.debug("(SIMULATED) HTTP session not created.")
             return None
         try:
-            session = requests.Session()
-            retries = Retry(total=5, backoff_factor=0.1, status_forcelist=[500, 502, 503, 504])
-            session.mount("http://", HTTPAdapter(max_retries=retries))
-            session.headers["Connection"] = "close"
-            logger.debug("HTTP session created with retry logic.")
-            return session
+            return type(self)._session_for(self.address)
         except Exception as e:
             logger.error(f"Failed to create HTTP session: {e}")
             raise JubileeCommunicationError("Failed to create HTTP session.") from e
 
+    @classmethod
+    def _session_for(cls, address: str) -> requests.Session:
+        """
+        Get or create the shared session for a machine address, so every controller talking
+        to the same Duet (including reconnects after reset) reuses one connection pool.
+        Args:
+            address (str): IP address of the machine.
+        Returns:
+            requests.Session: Configured session with retry logic and connection pooling.
+        """
+        with cls._sessions_lock:
+            session = cls._sessions.get(address)
+            if session is None:
+                session = requests.Session()
+                # Retry the read-only rr_model/rr_reply polls on 5xx. Commands are never retried: the
+                # /machine/code POST is not in DEFAULT_ALLOWED_METHODS, and rr_gcode is a GET that
+                # gets its own adapter below, since re-sending it could run a relative move twice.
+                retries = Retry(
+                    total=5,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                )
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, pool_block=False, max_retries=retries)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # Longest prefix wins, so legacy G-code GETs bypass the retrying adapter
+                session.mount(f"http://{address}/rr_gcode", HTTPAdapter(max_retries=0))
+                session.headers["Connection"] = "keep-alive"  # Reuse the TCP socket across G-code commands
+                cls._sessions[address] = session
+                logger.debug(f"HTTP session for {address} created with retry logic and connection pooling.")
+            return session
+
     def _retry_json(self, func: callable, max_tries: int = 15) -> dict:
         """
         Retry a function returning JSON until success or max tries.
+        Waits with capped exponential backoff and jitter between attempts. Only transient
+        errors (bad/empty JSON, communication failures) are retried; anything else propagates.
+        HTTP 503 `Retry-After` hints are already honoured by the session's urllib3 Retry.
         In simulation mode, returns a dummy result.
         Args:
             func (callable): Function to call.
@@ -312,31 +545,45 @@ class JubileeController:
         if self.simulated:
             logger.debug("(SIMULATED) returning dummy JSON result.")
             return {"result": [True, True, True, True]}
+        delay = 0.01
+        last_error = None
         for attempt in range(max_tries):
             try:
-                result = json.loads(func())
-                if result.get("result"):
+                result = _json_loads(func())
+                if result.get("result") is not None:
                     logger.debug(f"JSON command succeeded on attempt {attempt+1}.")
                     return result
-            except Exception as e:
+            except (ValueError, JubileeCommunicationError, requests.RequestException) as e:
+                last_error = e
                 logger.warning(f"JSON command failed on attempt {attempt+1}: {e}")
-                time.sleep(2)  # Wait 2 seconds between retries for robustness
+            time.sleep(delay + random.uniform(0, delay * 0.5))
+            delay = min(delay * 2, 1.0)
         logger.error("Max retries exceeded for JSON command.")
-        raise TimeoutError("Max retries exceeded for JSON command.")
+        raise TimeoutError("Max retries exceeded for JSON command.") from last_error
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # GCODE COMMUNICATION
     # ═══════════════════════════════════════════════════════════════════════════════
-    def gcode(self, cmd: str = "", timeout: float = None, response_wait: float = 60) -> str:
+    @in_order
+    def gcode(self, cmd: str = "", timeout: float = None, response_wait: float = 60, wait_reply: bool = True) -> str:
         """
         Send a G-Code command to the Machine and return the response.
+        With a Duet Software Framework (SBC) board, the POST to /machine/code blocks until
+        the reply is ready, so no polling happens. Standalone RepRapFirmware boards have no
+        /machine/code or WebSocket endpoint; for them the command goes through rr_gcode and
+        the reply counter is polled (see `_wait_for_reply_seq`).
+        With `wait_reply=False` the DSF endpoint queues the command and returns at once, so
+        following commands pipeline behind it. The firmware still runs codes in order, but
+        the reply (and any error in it) is lost. The rr_gcode path always waits, since the
+        next command's reply could not be told apart from this one's otherwise.
 
         Args:
             cmd (str): The G-Code command to send.
             timeout (float, optional): The time to wait for a response from the machine.
             response_wait (float, optional): The time to wait for a response from the machine.
+            wait_reply (bool, optional): If False, do not wait for the reply (DSF only).
         Returns:
-            str: The response message from the machine.
+            str: The response message from the machine, "" if the reply was not awaited.
         Raises:
             JubileeCommunicationError: If communication fails or if not connected.
         """
@@ -350,57 +597,285 @@ class JubileeController:
             if cmd.startswith("M119"):
                 return "X: open\nY: open\nZ: open\nU: open"
             return ""
+        self._position_cache = None  # Arbitrary G-code may move the machine or change offsets
+        self._absolute_positioning = None  # ...or switch G90/G91; callers that know the resulting mode set it again
+        # Decode explicitly: Response.text may run charset detection on every reply
+        response = self._send_gcode(cmd, timeout, response_wait, wait_reply).decode("utf-8", "replace")
+        logger.debug(f"G-code response: {response}")
+        return response
+
+    @in_order
+    def _query_model(self, key: str, timeout: float = None) -> bytes:
+        """
+        Read part of the object model with M409 and return the raw JSON reply.
+        The bytes go straight to the JSON parser without being decoded to str first, and
+        since the query has no side effects, the position and axis-word caches stay valid.
+        In simulation, returns the dummy M409 reply.
+        Args:
+            key (str): Object model key, e.g. "move.axes[].userPosition".
+            timeout (float, optional): The time to wait for a response from the machine.
+        Returns:
+            bytes: The JSON reply, e.g. b'{"key":"...","flags":"","result":[...]}'.
+        Raises:
+            JubileeCommunicationError: If communication fails or if not connected.
+        """
+        if self.simulated:
+            return self.gcode(f'M409 K"{key}"').encode()
+        return self._send_gcode(f'M409 K"{key}"', timeout)
+
+    def _send_gcode(self, cmd: str, timeout: float = None, response_wait: float = 60, wait_reply: bool = True) -> bytes:
+        """
+        Send a G-Code command over /machine/code, falling back to rr_gcode, and return the raw reply.
+        The fallback only happens when the command cannot have reached the machine (connection
+        refused, endpoint missing or code rejected); see `_post_machine_code`.
+        See `gcode` for the arguments.
+        Raises:
+            JubileeCommunicationError: If communication fails or if not connected.
+        """
         if self.session is None:
             logger.error("Attempted to send G-code while not connected. Call connect() first.")
             raise JubileeCommunicationError("Not connected: call connect() before sending G-code commands.")
+        if self._machine_code_supported is not False:
+            response = self._post_machine_code(cmd, timeout, wait_reply)
+            if response is not None:
+                self._machine_code_supported = True
+                return response
+        return self._legacy_rr_gcode(cmd, timeout, response_wait)
+
+    def _post_machine_code(self, cmd: str, timeout: float = None, wait_reply: bool = True) -> Optional[bytes]:
+        """
+        Send a G-Code command through the DSF /machine/code endpoint.
+        Args:
+            cmd (str): The G-Code command to send.
+            timeout (float, optional): The time to wait for a response from the machine.
+            wait_reply (bool, optional): If False, ask DSF to queue the code and return at once.
+        Returns:
+            bytes | None: The raw response, or None if the code was not run and should go through
+                rr_gcode instead: connection refused before sending, endpoint missing (404) or
+                code rejected.
+                The first refusal or 404, before the endpoint ever answered, marks /machine/code
+                as unsupported for the rest of the session.
+        Raises:
+            JubileeCommunicationError: On a timeout or any other failure after the request may
+                have been accepted; re-sending it through rr_gcode could run the code twice.
+        """
         try:
             logger.debug(f"Sending G-code via /machine/code: {cmd}")
-            response = self.session.post(f"http://{self.address}/machine/code", data=cmd, timeout=timeout).text
-            if "rejected" not in response:
-                logger.debug(f"G-code response: {response}")
-                return response
-        except requests.RequestException as e:
+            request = self._machine_code_request(wait_reply).copy()
+            request.body = cmd.encode("utf-8")
+            request.headers["Content-Length"] = str(len(request.body))
+            response = self.session.send(request, timeout=timeout)
+        except requests.Timeout as e:
+            # Checked first: ConnectTimeout is also a ConnectionError
+            logger.warning(f"/machine/code request timed out: {e}")
+            self._absolute_positioning = None  # The command may or may not have been applied
+            raise JubileeCommunicationError(f"G-code communication failed: {e}") from e
+        except requests.ConnectionError as e:
+            if not self._failed_to_connect(e):
+                # The request may have reached the board before the connection dropped
+                logger.warning(f"/machine/code connection lost: {e}")
+                self._absolute_positioning = None
+                raise JubileeCommunicationError(f"G-code communication failed: {e}") from e
             logger.warning(f"/machine/code endpoint failed: {e}")
-            # Fallback to rr_gcode method below
+            self._mark_machine_code_unsupported()
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"G-code communication failed: {e}")
+            self._absolute_positioning = None
+            raise JubileeCommunicationError(f"G-code communication failed: {e}") from e
+        if response.status_code == 404:
+            self._mark_machine_code_unsupported()
+            return None
+        content = response.content
+        if b"rejected" in content:
+            return None
+        return content
+
+    @staticmethod
+    def _failed_to_connect(error: requests.ConnectionError) -> bool:
+        """
+        Tell whether a ConnectionError happened while opening the socket, so nothing was sent.
+        requests wraps the urllib3 error, usually inside a MaxRetryError carrying the reason.
+        Args:
+            error (requests.ConnectionError): The error raised by the session.
+        Returns:
+            bool: True for refused connections and DNS failures, False for e.g. a reset after sending.
+        """
+        reason = error.args[0] if error.args else None
+        if isinstance(reason, MaxRetryError):
+            reason = reason.reason
+        return isinstance(reason, NewConnectionError)
+
+    def _mark_machine_code_unsupported(self) -> None:
+        """
+        Switch to rr_gcode for good if /machine/code has never answered on this board.
+        Once it has, a failure is treated as transient and only that command falls back.
+        """
+        if self._machine_code_supported is None:
+            logger.info("/machine/code is not available; using the rr_gcode endpoint from now on.")
+            self._machine_code_supported = False
+
+    def _machine_code_request(self, wait_reply: bool = True) -> requests.PreparedRequest:
+        """
+        Return the prepared /machine/code POST for this session, building it on first use.
+        URL parsing and header merging happen once; callers copy it and only set the body.
+        Args:
+            wait_reply (bool, optional): If False, the request carries async=true (see `gcode`).
+        Returns:
+            requests.PreparedRequest: Template request without a body. Do not modify it in place.
+        """
+        request = self._machine_code_requests.get(wait_reply)
+        if request is None:
+            request = self.session.prepare_request(requests.Request(
+                "POST",
+                f"http://{self.address}/machine/code",
+                params=None if wait_reply else {"async": "true"},
+            ))
+            self._machine_code_requests[wait_reply] = request
+        return request
+
+    def _legacy_rr_gcode(self, cmd: str, timeout: float = None, response_wait: float = 60) -> bytes:
+        """
+        Send a G-Code command through the standalone RepRapFirmware rr_gcode endpoint and
+        wait for its reply.
+        Args:
+            cmd (str): The G-Code command to send.
+            timeout (float, optional): The time to wait for a response from the machine.
+            response_wait (float, optional): The time to wait for a response from the machine.
+        Returns:
+            bytes: The raw response message from the machine.
+        Raises:
+            JubileeCommunicationError: If communication fails.
+        """
         try:
-            reply_count = self.session.get(f"http://{self.address}/rr_model?key=seqs").json()["result"]["reply"]
+            # Read right before sending: other clients (web interface, macros, firmware messages)
+            # also advance the reply sequence, so a value remembered from our last reply can be stale
+            reply_count = self._reply_seq()
             self.session.get(f"http://{self.address}/rr_gcode?gcode={cmd}", timeout=timeout)
-            tic = time.time()
-            while True:
-                new_count = self.session.get(f"http://{self.address}/rr_model?key=seqs").json()["result"]["reply"]
-                if new_count != reply_count:
-                    response = self.session.get(f"http://{self.address}/rr_reply").text
-                    if self.crash_detection and "crash detected" in response:
-                        logger.error("Crash detected during G-code execution!")
-                        raise JubileeStateError("Crash detected during G-code execution!")
-                    logger.debug(f"G-code reply: {response}")
-                    return response
-                if time.time() - tic > response_wait:
-                    logger.error(f"Timeout waiting for G-code reply after {response_wait} seconds.")
-                    raise JubileeCommunicationError("Timeout waiting for G-code reply.")
-                time.sleep(self._delay_time(int((time.time() - tic) * 10)))
+            self._wait_for_reply_seq(reply_count, response_wait)
+            reply = self.session.get(f"http://{self.address}/rr_reply").content
+            if self.crash_detection and _CRASH_MARKER in reply:
+                logger.error("Crash detected during G-code execution!")
+                raise JubileeStateError("Crash detected during G-code execution!")
+            return reply
         except Exception as e:
             logger.warning(f"G-code communication failed: {e}")
+            self._absolute_positioning = None  # The command may or may not have been applied
             raise JubileeCommunicationError(f"G-code communication failed: {e}") from e
-        
-    def _delay_time(self, n: int) -> float:
+
+    def gcode_batch(self, cmds: list[str], timeout: float = None, response_wait: float = 60, wait_reply: bool = True) -> str:
         """
-        Calculate delay time for next request. (Simple hardcoded backoff)
+        Send several G-Code commands to the Machine in a single request.
+        The commands are joined into one multi-line block, so the whole batch costs one
+        HTTP round trip instead of one per line.
+
         Args:
-            n (int): Number of attempts.
+            cmds (list[str]): The G-Code commands to send, in execution order.
+            timeout (float, optional): The time to wait for a response from the machine.
+            response_wait (float, optional): The time to wait for a response from the machine.
+            wait_reply (bool, optional): If False, do not wait for the reply (see `gcode`).
         Returns:
-            float: Delay in seconds.
-        """
-        if n == 0:
-            return 0
-        if n < 10:
-            return 0.1
-        if n < 20:
-            return 0.2
-        if n < 30:
-            return 0.3
-        else:
-            return 1
+            str: The combined response message from the machine.
+        Raises:
+            JubileeCommunicationError: If communication fails or if not connected.
+        """
+        cmds = [cmd for cmd in cmds if cmd]
+        if not cmds:
+            return ""
+        return self.gcode("\n".join(cmds), timeout=timeout, response_wait=response_wait, wait_reply=wait_reply)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # PIPELINED (ASYNC) SUBMISSION
+    # ═══════════════════════════════════════════════════════════════════════════════
+    def _submit(self, func: callable, *args, **kwargs) -> Future:
+        """
+        Queue a call on the single G-code worker and return its Future.
+        One worker keeps commands in submission order; at most MAX_IN_FLIGHT calls can be
+        pending, further submissions block until a slot frees up.
+        Args:
+            func (callable): Controller method to run on the worker.
+        Returns:
+            Future: Resolves to the return value of `func`.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="jubilee-gcode", initializer=self._register_worker)
+        self._in_flight.acquire()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except Exception:
+            self._in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self._in_flight.release())
+        return future
+
+    def _register_worker(self) -> None:
+        """
+        Record the worker thread, so `in_order` methods called from it run directly.
+        """
+        self._worker_ident = threading.get_ident()
+
+    def _shutdown_executor(self) -> None:
+        """
+        Wait for pending async submissions and stop the worker, if any.
+        """
+        if self._executor is not None:
+            logger.debug("Waiting for pending async G-code submissions.")
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._worker_ident = None
+
+    def gcode_async(self, cmd: str = "", timeout: float = None, response_wait: float = 60) -> Future:
+        """
+        Queue a G-Code command and return immediately, so the caller can keep preparing the
+        next commands while the machine processes this one.
+        Commands are sent in order over the same session as gcode(). Sync calls made meanwhile
+        (moves, gcode(), get_position(), ...) wait for the queued commands first (see `in_order`);
+        from asyncio code, await the result with `asyncio.wrap_future(controller.gcode_async(cmd))`.
+
+        Args:
+            cmd (str): The G-Code command to send.
+            timeout (float, optional): The time to wait for a response from the machine.
+            response_wait (float, optional): The time to wait for a response from the machine.
+        Returns:
+            Future: Resolves to the response message from the machine.
+        """
+        return self._submit(self.gcode, cmd, timeout=timeout, response_wait=response_wait)
+
+    def _reply_seq(self) -> int:
+        """
+        Read the firmware reply sequence number.
+        Only the scalar `seqs.reply` is requested, not the whole `seqs` object.
+        Returns:
+            int: Current reply sequence number.
+        """
+        return _json_loads(self.session.get(f"http://{self.address}/rr_model?key=seqs.reply").content)["result"]
+
+    def _wait_for_reply_seq(self, reply_count: int, response_wait: float) -> int:
+        """
+        Block until the firmware reply sequence moves past `reply_count`.
+        Standalone RepRapFirmware has no push channel on the rr_* API, so this polls
+        the reply counter; the /machine/code endpoint already blocks until the reply.
+        The delay between polls grows exponentially from `poll_interval_min` up to
+        `poll_interval_max`, with a little jitter.
+        Args:
+            reply_count (int): Reply sequence number read before the command was sent.
+            response_wait (float): Maximum time to wait for the reply, in seconds.
+        Returns:
+            int: The new reply sequence number.
+        Raises:
+            JubileeCommunicationError: If no reply arrives within `response_wait`.
+        """
+        tic = time.time()
+        attempt = 0
+        while (seq := self._reply_seq()) == reply_count:
+            if time.time() - tic > response_wait:
+                logger.error(f"Timeout waiting for G-code reply after {response_wait} seconds.")
+                raise JubileeCommunicationError("Timeout waiting for G-code reply.")
+            delay = min(self.poll_interval_max, self.poll_interval_min * 1.5 ** attempt)
+            time.sleep(delay + random.uniform(0, 0.01))
+            attempt += 1
+        return seq
 
     def push_machine_state(self) -> None:
         """
@@ -414,11 +889,12 @@ class JubileeController:
             return
         try:
             logger.debug("Pushing machine state (M120).")
-            self.gcode("M120")
+            self.gcode("M120", wait_reply=False)
         except Exception as e:
             logger.error(f"Failed to push machine state: {e}")
             raise JubileeStateError("Failed to push machine state.") from e
 
+    @in_order
     def pop_machine_state(self) -> None:
         """
         Recover previous machine state.
@@ -432,10 +908,42 @@ class JubileeController:
         try:
             logger.debug("Popping machine state (M121).")
             self.gcode("M121")
+            self._absolute_positioning = None  # M121 may restore either positioning mode
         except Exception as e:
             logger.error(f"Failed to pop machine state: {e}")
             raise JubileeStateError("Failed to pop machine state.") from e
 
+    def download_file(self, filepath: str, timeout: float = None) -> Optional[requests.Response]:
+        """
+        Download a file from the machine as a streamed response. Full machine filepath must be specified.
+        Example: /sys/tfree0.g
+        The body is not buffered: read it with `response.iter_content(chunk_size=65536)` or
+        `shutil.copyfileobj(response.raw, out)`, and close the response when done.
+        In simulation mode, just logs and returns None.
+        Args:
+            filepath (str): Full path of the file on the machine.
+            timeout (float, optional): The time to wait for a response from the machine.
+        Returns:
+            requests.Response | None: Streamed response, or None if simulated.
+        Raises:
+            JubileeCommunicationError: If the download fails or if not connected.
+        """
+        if self.simulated:
+            logger.info(f"(SIMULATED) download_file(filepath={filepath})")
+            return None
+        if self.session is None:
+            logger.error("Attempted to download a file while not connected. Call connect() first.")
+            raise JubileeCommunicationError("Not connected: call connect() before downloading files.")
+        try:
+            response = self.session.get(
+                f"http://{self.address}/rr_download", params={"name": filepath}, timeout=timeout, stream=True
+            )
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error(f"Failed to download '{filepath}': {e}")
+            raise JubileeCommunicationError(f"Failed to download '{filepath}'.") from e
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # HOMING
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -511,6 +1019,7 @@ class JubileeController:
             logger.error(f"Homing Z failed: {e}")
             raise JubileeHomingError("Failed to home Z axis.") from e  
 
+    @in_order
     def home_xyu(self) -> None:
         """
         Home the X, Y, and U axes. In simulation, just logs and sets dummy state.
@@ -522,21 +1031,21 @@ class JubileeController:
             self.axes_homed = [True, True, True, True]
             return
         try:
-            self._home_u()
-            self._home_y()
-            self._home_x()
-            self._set_absolute_positioning()
+            self.gcode_batch(["G28 U", "G28 Y", "G28 X", "G90"])
+            self.axes_homed[0] = self.axes_homed[1] = self.axes_homed[3] = True
+            self._absolute_positioning = True
             # Update homing status from Duet object model (avoids race condition)
-            homed_status = json.loads(self.gcode('M409 K"move.axes[].homed"'))["result"]
+            homed_status = _json_loads(self._query_model("move.axes[].homed"))["result"]
             self.axes_homed = [True, True, homed_status[2], True]
         except Exception as e:
             logger.error(f"Homing XYU failed: {e}")
             raise JubileeHomingError("Failed to home XYU axes.") from e            
        
     @safe_homing
+    @in_order
     def home_all(self) -> None:
         """
-        Home all axes (X, Y, Z, U).
+        Home all axes (X, Y, Z, U), sending the whole sequence as one batch.
         In simulation, sets all axes as homed and logs the action.
         Raises:
             JubileeHomingError: If homing any axis fails.
@@ -546,8 +1055,8 @@ class JubileeController:
             self.axes_homed = [True, True, True, True]
             return
         try:
-            self.home_xyu()
-            self._home_z()
+            self.gcode_batch(["G28 U", "G28 Y", "G28 X", "G28 Z", "G90"])
+            self._absolute_positioning = True
             logger.info("All axes homed successfully.")
             self.axes_homed = [True, True, True, True]  # X, Y, Z, U
         except Exception as e:
@@ -569,37 +1078,47 @@ class JubileeController:
             return
         if not confirm:
             raise RuntimeError("Dangerous operation: set confirm=True to override.")
+        cmds = []
         for axis in args:
             if axis.upper() not in ["X", "Y", "Z", "U"]:
                 raise TypeError(f"Unknown axis: {axis}")
-            self.gcode(f"G92 {axis.upper()}0")
+            cmds.append(f"G92 {axis.upper()}0")
+        self.gcode_batch(cmds, wait_reply=False)
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # MOTION & POSITIONING
     # ═══════════════════════════════════════════════════════════════════════════════
+    @in_order
     def _set_absolute_positioning(self) -> None:
         """
         Set machine to absolute positioning mode (G90). In simulation, just logs.
+        Skipped if the machine is already known to be in absolute mode.
         """
         if self.simulated:
             logger.debug("(SIMULATED) set absolute positioning (G90).")
             self._absolute_positioning = True
             return
-        self.gcode("G90")
+        if self._absolute_positioning is True:
+            return
+        self.gcode("G90", wait_reply=False)
         self._absolute_positioning = True
 
+    @in_order
     def _set_relative_positioning(self) -> None:
         """
         Set relative positioning mode for all axes except extrusion (G91). In simulation, just logs.
+        Skipped if the machine is already known to be in relative mode.
         """
         if self.simulated:
             logger.debug("(SIMULATED) set relative positioning (G91).")
             self._absolute_positioning = False
             return
-        self.gcode("G91")
+        if self._absolute_positioning is False:
+            return
+        self.gcode("G91", wait_reply=False)
         self._absolute_positioning = False
 
-    @machine_homed
+    @in_order
     def _move_xyzu(
         self,
         x: float = None,
@@ -609,9 +1128,11 @@ class JubileeController:
         s: float = 6000,
         param: str = None,
         wait: bool = False,
+        absolute: bool = None,
     ) -> None:
         """
         Move the machine to the specified (x, y, z, u) position.
+        The positioning mode change, the move and the optional M400 are sent as one batch.
         Args:
             x (float, optional): Target X coordinate.
             y (float, optional): Target Y coordinate.
@@ -620,22 +1141,36 @@ class JubileeController:
             s (float, optional): Speed/feedrate.
             param (str, optional): Extra G-code parameters.
             wait (bool, optional): Wait for move to complete.
+            absolute (bool, optional): If set, switch to absolute (G90) or relative (G91) positioning first.
+                The mode command is only sent when it differs from the cached mode.
         Raises:
             JubileeStateError: If move fails or machine not homed.
         """
         if self.simulated:
             logger.debug(f"(SIMULATED) move XYZU (x={x}, y={y}, z={z}, u={u}, s={s}, param={param}, wait={wait})")
-            self.gcode(f"G0 X{x} Y{y} Z{z} U{u} F{s}")
-            if wait:
-                self.gcode("M400")
-            return
-        axes = {"X": x, "Y": y, "Z": z, "U": u, "F": s}
-        cmd_parts = [f"{axis}{value:.2f}" for axis, value in axes.items() if value is not None]
-        if param:
-            cmd_parts.append(param)
-        self.gcode(f"G0 {' '.join(cmd_parts)}")
+            if absolute is not None:
+                self._absolute_positioning = absolute
+            return
+        # Homing check inlined from machine_homed: this is the hot path for every move
+        homed = self.axes_homed
+        if not (homed[0] and homed[1] and homed[2] and homed[3]):
+            _require_homed(self)
+        position = self._position_cache
+        mode = self._absolute_positioning if absolute is None else absolute
+        cmds = []
+        if absolute is not None and absolute is not self._absolute_positioning:
+            cmds.append("G90" if absolute else "G91")
+        cmds.append(_format_move(x, y, z, u, s, param))
         if wait:
-            self.gcode("M400")  # Wait for moves to complete
+            cmds.append("M400")  # Wait for moves to complete
+        self.gcode_batch(cmds)
+        self._absolute_positioning = mode  # A plain move leaves the positioning mode as it was
+        if position is not None and mode is not None:
+            # gcode() cleared the cache; advance it by this move instead of re-querying
+            for axis, value in (("X", x), ("Y", y), ("Z", z), ("U", u)):
+                if value is not None and axis in position:
+                    position[axis] = value if mode else position[axis] + value
+            self._position_cache = position
 
     def _check_axis_limits(self, target: dict, relative: bool = False) -> None:
         """
@@ -649,11 +1184,15 @@ class JubileeController:
         if self.simulated:
             logger.debug("(SIMULATED) _check_axis_limits() called.")
             return
-        if not any(self._axis_limits):
+        if all(value is None for value in target.values()):
+            return  # Nothing to check (e.g. U-only move), and no position query needed
+        if self._axis_limits is None:
+            self._refresh_axes_config()
+        limits = self._axis_limits_by_letter
+        if not limits:
             logger.error("Axis limits are not configured.")
             raise JubileeConfigurationError("Axis limits are not configured.")
-        limits = dict(zip(("X", "Y", "Z"), self._axis_limits[:3]))
-        pos = self.get_position() if relative else {}
+        pos = (self._position_cache or self.get_position()) if relative else {}
         for axis, value in target.items():
             if value is None or axis not in limits or limits[axis] is None:
                 continue
@@ -664,58 +1203,118 @@ class JubileeController:
                 raise JubileeStateError(
                     f"{kind} move exceeds {axis} axis limit ({limits[axis][0]}–{limits[axis][1]} mm)")
 
+    @in_order
     def move_to(self, x=None, y=None, z=None, u=None, s=6000, param=None, wait=False):
         """Perform an absolute move to the specified X, Y, Z, U coordinates. In simulation, logs the simulated command."""
         if self.simulated:
             logger.info(f"(SIMULATED) move_to(x={x}, y={y}, z={z}, u={u}, s={s}, param={param}, wait={wait})")
-            self._set_absolute_positioning()
-            self._check_axis_limits({"X": x, "Y": y, "Z": z}, relative=False)
-            self._move_xyzu(x=x, y=y, z=z, u=u, s=s, param=param, wait=wait)
+            # Nothing is checked or sent in simulation; skip the no-op check/move/gcode chain
+            self._absolute_positioning = True
             return
         try:
-            self._set_absolute_positioning()
             self._check_axis_limits({"X": x, "Y": y, "Z": z}, relative=False)
-            self._move_xyzu(x=x, y=y, z=z, u=u, s=s, param=param, wait=wait)
-        except JubileeConfigurationError as e:
-            logger.error(f"Configuration error during move_to: {e}")
-            raise
-        except JubileeStateError as e:
-            logger.error(f"State error during move_to: {e}")
-            raise
+            self._move_xyzu(x=x, y=y, z=z, u=u, s=s, param=param, wait=wait, absolute=True)
         except Exception as e:
-            logger.error(f"Unexpected error during move_to: {e}")
+            logger.error(f"{type(e).__name__} during move_to: {e}")
             raise
 
+    @in_order
     def move(self, dx=None, dy=None, dz=None, du=None, s=6000, param=None, wait=False):
         """Perform a relative move by the specified deltas (ΔX, ΔY, etc.). In simulation, logs the simulated command."""
         if self.simulated:
             logger.info(f"(SIMULATED) move(dx={dx}, dy={dy}, dz={dz}, du={du}, s={s}, param={param}, wait={wait})")
-            self._set_relative_positioning()
-            self._check_axis_limits({"X": dx, "Y": dy, "Z": dz}, relative=True)
-            self._move_xyzu(x=dx, y=dy, z=dz, u=du, s=s, param=param, wait=wait)
+            # Nothing is checked or sent in simulation; skip the no-op check/move/gcode chain
+            self._absolute_positioning = False
             return
         try:
-            self._set_relative_positioning()
             self._check_axis_limits({"X": dx, "Y": dy, "Z": dz}, relative=True)
-            self._move_xyzu(x=dx, y=dy, z=dz, u=du, s=s, param=param, wait=wait)
-        except JubileeConfigurationError as e:
-            logger.error(f"Configuration error during move: {e}")
-            raise
-        except JubileeStateError as e:
-            logger.error(f"State error during move: {e}")
-            raise
+            self._move_xyzu(x=dx, y=dy, z=dz, u=du, s=s, param=param, wait=wait, absolute=False)
         except Exception as e:
-            logger.error(f"Unexpected error during move: {e}")
+            logger.error(f"{type(e).__name__} during move: {e}")
             raise
 
-    def dwell(self, t: float, millis: bool = True):
-        """Pauses the machine for a period of time. In simulation, just logs."""
+    @in_order
+    @machine_homed
+    def move_to_many(self, xyz, s: float = 6000, wait: bool = False) -> None:
+        """
+        Perform absolute moves through a batch of (x, y, z) waypoints.
+        All waypoints are checked against the axis limits in one vectorized comparison,
+        then sent as a single G-code batch. In simulation, logs the simulated command.
+        Args:
+            xyz (array-like): Waypoints, shape (N, 3).
+            s (float, optional): Speed/feedrate.
+            wait (bool, optional): Wait for the last move to complete.
+        Raises:
+            JubileeConfigurationError: If the waypoints are malformed or axis limits are not configured.
+            JubileeStateError: If any waypoint is out of bounds.
+        """
+        xyz = np.asarray(xyz, dtype=float)
+        if xyz.ndim != 2 or xyz.shape[1] != 3:
+            logger.error(f"move_to_many expects waypoints of shape (N, 3), got {xyz.shape}.")
+            raise JubileeConfigurationError(f"move_to_many expects waypoints of shape (N, 3), got {xyz.shape}.")
+        if self.simulated:
+            logger.info(f"(SIMULATED) move_to_many({len(xyz)} waypoints, s={s}, wait={wait})")
+            self._absolute_positioning = True
+            return
+        if self._axis_limits is None:
+            self._refresh_axes_config()
+        if self._xyz_limits is None:
+            logger.error("Axis limits are not configured.")
+            raise JubileeConfigurationError("Axis limits are not configured.")
+        lower, upper = self._xyz_limits[:, 0], self._xyz_limits[:, 1]
+        out_of_bounds = ~((xyz >= lower) & (xyz <= upper))  # Also catches NaN, which compares False
+        if out_of_bounds.any():
+            row, col = np.argwhere(out_of_bounds)[0]
+            axis = "XYZ"[col]
+            logger.error(f"Absolute move exceeds {axis} axis limit ({lower[col]}–{upper[col]} mm) at waypoint {row}")
+            raise JubileeStateError(f"Absolute move exceeds {axis} axis limit ({lower[col]}–{upper[col]} mm) at waypoint {row}")
+        cmds = [] if self._absolute_positioning is True else ["G90"]
+        # Waypoints of one batch run back to back, so each line only repeats the words that changed
+        previous = None
+        for point in np.round(xyz, 2).tolist():
+            if previous is None:
+                cmds.append(_MOVE_XYZ % (*point, s))
+            else:
+                words = "".join(f" {a}{v:.2f}" for a, v, p in zip("XYZ", point, previous) if v != p)
+                if words:
+                    cmds.append("G0" + words)
+            previous = point
+        if wait:
+            cmds.append("M400")
+        self.gcode_batch(cmds)
+        self._absolute_positioning = True
+
+    def move_to_async(self, x=None, y=None, z=None, u=None, s=6000, param=None, wait=False) -> Future:
+        """
+        Queue an absolute move and return immediately. Limits are checked before queueing;
+        the homing check and the move itself run in order on the G-code worker.
+        Call `.result()` on the returned Future (or disconnect()) before relying on the position.
+        """
+        self._check_axis_limits({"X": x, "Y": y, "Z": z}, relative=False)
+        if self.simulated:
+            logger.info(f"(SIMULATED) move_to_async(x={x}, y={y}, z={z}, u={u}, s={s}, param={param}, wait={wait})")
+        return self._submit(self._move_xyzu, x=x, y=y, z=z, u=u, s=s, param=param, wait=wait, absolute=True)
+
+    def dwell(self, t: float, millis: bool = True, blocking: bool = False):
+        """
+        Pauses the machine for a period of time. In simulation, just logs.
+        By default the dwell is only queued: following commands still run after it, but the
+        call returns before the pause is over. Pass blocking=True (or call flush() later)
+        when host-side code must wait for it, e.g. before reading an external sensor.
+        """
         if self.simulated:
-            logger.info(f"(SIMULATED) dwell(t={t}, millis={millis})")
+            logger.info(f"(SIMULATED) dwell(t={t}, millis={millis}, blocking={blocking})")
             return
         param = "P" if millis else "S"
         cmd = f"G4 {param}{t}"
-        self.gcode(cmd)
+        self.gcode(cmd, wait_reply=blocking)
+
+    def flush(self) -> None:
+        """Wait until all queued moves and dwells have finished (M400). In simulation, just logs."""
+        if self.simulated:
+            logger.info("(SIMULATED) flush()")
+            return
+        self.gcode("M400")
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # TOOL LOCK/UNLOCK OPERATIONS (MACROS & GENERIC)
@@ -729,8 +1328,7 @@ class JubileeController:
         if self.simulated:
             logger.info(f"(SIMULATED) tool_lock_macro()")
             return
-        cmd = 'M98 P"0:/macros/tool_manager/tool_lock.g"'
-        self.gcode(cmd)
+        self.gcode(self._TOOL_LOCK_CMD)
 
     def tool_unlock_macro(self) -> None:
         """
@@ -741,30 +1339,27 @@ class JubileeController:
         if self.simulated:
             logger.info(f"(SIMULATED) tool_unlock_macro()")
             return
-        cmd = 'M98 P"0:/macros/tool_manager/tool_unlock.g"'
-        self.gcode(cmd)
+        self.gcode(self._TOOL_UNLOCK_CMD)
 
     def pickup_tool_macro(self, index: int):
         """Runs Jubilee tool unlock macro for tool index between 0 and 3. In simulation, just logs."""
         if self.simulated:
             logger.info(f"(SIMULATED) pickup_tool(index={index})")
             return
-        if not 0 <= index <= 3:
+        if index not in self._VALID_TOOL_INDICES:
             logger.error(f"Invalid tool index {index} for pickup_tool_macro.")
             raise JubileeStateError("Tool index must be between 0 and 3.")
-        cmd = f'M98 P"0:/macros/tool_manager/pickup_tool/pickup_tool{index}.g"'
-        self.gcode(cmd)
+        self.gcode(self._PICKUP_CMDS[index])
 
     def park_tool_macro(self, index: int):
         """Runs Jubilee tool lock macro for tool index between 0 and 3. In simulation, just logs."""
         if self.simulated:
             logger.info(f"(SIMULATED) park_tool(index={index})")
             return
-        if not 0 <= index <= 3:
+        if index not in self._VALID_TOOL_INDICES:
             logger.error(f"Invalid tool index {index} for park_tool_macro.")
             raise JubileeStateError("Tool index must be between 0 and 3.")
-        cmd = f'M98 P"0:/macros/tool_manager/park_tool/park_tool{index}.g"'
-        self.gcode(cmd)
+        self.gcode(self._PARK_CMDS[index])
     
 
     def tool_lock(self) -> None:
@@ -783,6 +1378,7 @@ class JubileeController:
         """
         self.tool_unlock_macro()
 
+    @in_order
     def pickup_tool_sequence(
         self,
         index: int,
@@ -802,21 +1398,17 @@ class JubileeController:
         if self.simulated:
             logger.info(f"(SIMULATED) pickup_tool_sequence(index={index}, z_park={z_park})")
             return
-        if index not in self.tool_parking_positions:
+        if index not in self._parking_tuples:
             logger.error(f"No parking position defined for tool {index}.")
             raise JubileeStateError(f"No parking position defined for tool {index}.")
-        pos = self.tool_parking_positions[index]
-        z = z_park if z_park is not None else pos["z_park"]
-        # 1. Move to approach position in front of the parking post
-        self.move_to(x=pos["x_park"], y=pos["y_clear"], z=z, s=speed, wait=True)
+        # 1. Move to the approach position in front of the parking post
         # 2. Move in Y to pick up the tool
-        self.move_to(x=pos["x_park"], y=pos["y_park"], z=z, s=speed, wait=True)
-        # 3. Mechanically lock the tool
-        self.tool_lock()
-        # 4. Retract to the approach position
-        self.move_to(x=pos["x_park"], y=pos["y_clear"], z=z, s=speed, wait=True)
+        # 3. Wait for the dock move, then mechanically lock the tool
+        # 4. Retract to the approach position and wait
+        self._tool_change_batch(index, z_park, speed, self._TOOL_LOCK_CMD)
         logger.info(f"pickup_tool_sequence completed for tool {index}.")
 
+    @in_order
     def park_tool_sequence(
         self,
         index: int,
@@ -836,69 +1428,172 @@ class JubileeController:
         if self.simulated:
             logger.info(f"(SIMULATED) park_tool_sequence(index={index}, z_park={z_park})")
             return
-        if index not in self.tool_parking_positions:
+        if index not in self._parking_tuples:
             logger.error(f"No parking position defined for tool {index}.")
             raise JubileeStateError(f"No parking position defined for tool {index}.")
-        pos = self.tool_parking_positions[index]
-        z = z_park if z_park is not None else pos["z_park"]
-        # 1. Move to approach position in front of the parking post
-        self.move_to(x=pos["x_park"], y=pos["y_clear"], z=z, s=speed, wait=True)
+        # 1. Move to the approach position in front of the parking post
         # 2. Move in Y to park the tool
-        self.move_to(x=pos["x_park"], y=pos["y_park"], z=z, s=speed, wait=True)
-        # 3. Mechanically unlock the tool
-        self.tool_unlock()
-        # 4. Retract to the approach position
-        self.move_to(x=pos["x_park"], y=pos["y_clear"], z=z, s=speed, wait=True)
+        # 3. Wait for the dock move, then mechanically unlock the tool
+        # 4. Retract to the approach position and wait
+        self._tool_change_batch(index, z_park, speed, self._TOOL_UNLOCK_CMD)
         logger.info(f"park_tool_sequence completed for tool {index}.")
+
+    def pickup_tool_sequence_async(self, index: int, z_park: float = None, speed: float = 6000) -> Future:
+        """
+        Queue pickup_tool_sequence() on the G-code worker and return immediately, so the caller
+        can prepare the next steps while the tool change runs. Commands queued afterwards
+        (e.g. with move_to_async) run once it has finished. Errors are raised by `.result()`.
+        """
+        return self._submit(self.pickup_tool_sequence, index, z_park=z_park, speed=speed)
+
+    def park_tool_sequence_async(self, index: int, z_park: float = None, speed: float = 6000) -> Future:
+        """
+        Queue park_tool_sequence() on the G-code worker and return immediately.
+        See pickup_tool_sequence_async().
+        """
+        return self._submit(self.park_tool_sequence, index, z_park=z_park, speed=speed)
+
+    def _tool_change_batch(self, index: int, z_park: float, speed: float, macro_cmd: str) -> None:
+        """
+        Send a whole tool-change sequence (approach, dock, M400, macro, G90, retract, M400) as one
+        G-code batch, in absolute positioning. The dock move completes before the lock/unlock
+        macro runs, as with separate calls, but the round trips in between are saved. The
+        approach is always sent, since the machine may have been jogged since the last move.
+        The macro may switch to G91, so absolute positioning is restored before the retract.
+        Raises:
+            JubileeStateError: If the combined reply contains an Error line (e.g. the macro failed).
+        """
+        approach, dock, retract = self._dock_moves(index, z_park, speed)
+        # Two barriers only. The lock/unlock macro does not wait for queued moves itself, so an M400
+        # must end the dock before it. The trailing M400 covers the retract. The approach and dock
+        # stay chained with no wait between them.
+        cmds = [approach, dock, "M400", macro_cmd, "G90", retract, "M400"]
+        if self._absolute_positioning is not True:
+            cmds = ["G90", *cmds]
+        response = self.gcode_batch(cmds)
+        self._absolute_positioning = True  # Re-established by the G90 after the macro
+        errors = [line for line in response.splitlines() if line.startswith("Error")]
+        if errors:
+            logger.error(f"Tool change for tool {index} reported: {'; '.join(errors)}")
+            raise JubileeStateError(f"Tool change for tool {index} failed: {'; '.join(errors)}")
+
+    def plan_tool_changes(self, indices: list[int]) -> np.ndarray:
+        """
+        Compute the X/Y/Z waypoints of a series of tool changes without sending anything.
+        Args:
+            indices (list[int]): Tool indices, in the order they will be picked up or parked.
+        Returns:
+            np.ndarray: (3 * len(indices), 3) array holding, per tool change, the approach,
+                dock and retract positions at the default park height.
+        Raises:
+            JubileeStateError: If a tool has no parking position.
+        """
+        try:
+            rows = [self._park_rows[index] for index in indices]
+        except KeyError as e:
+            logger.error(f"No parking position defined for tool {e}.")
+            raise JubileeStateError(f"No parking position defined for tool {e}.") from e
+        park = self._park_array[rows]  # columns: x_park, y_clear, y_park, z_park
+        waypoints = np.empty((len(rows), 3, 3))
+        waypoints[:, :, 0] = park[:, 0:1]
+        waypoints[:, :, 1] = park[:, [1, 2, 1]]
+        waypoints[:, :, 2] = park[:, 3:4]
+        return waypoints.reshape(-1, 3)
+
+    @machine_homed
+    def _dock_moves(self, index: int, z_park: float = None, speed: float = 6000) -> tuple[str, str, str]:
+        """
+        Return the (approach, dock, retract) G0 lines for a tool's parking post, checked against the axis limits.
+        Uses the strings built in __init__ unless a custom Z or speed is requested.
+        """
+        x_park, y_clear, y_park, z = self._parking_tuples[index]
+        if z_park is not None:
+            z = z_park
+        self._check_axis_limits({"X": x_park, "Y": y_clear, "Z": z})
+        self._check_axis_limits({"X": x_park, "Y": y_park, "Z": z})
+        if z_park is None and speed == 6000:
+            return self._park_gcode[index]
+        return _dock_gcode(x_park, y_clear, y_park, z, speed)
     
     # ═══════════════════════════════════════════════════════════════════════════════
     # STATUS READERS & PROPERTIES
     # ═══════════════════════════════════════════════════════════════════════════════
+    def _refresh_axes_config(self) -> None:
+        """
+        Fetch axis letters and limits with a single M409 query and cache them.
+        The axis configuration does not change at runtime, so this only runs the first time
+        axes or limits are needed, and again after reset() or invalidate_axis_cache().
+        """
+        if self.simulated:
+            self._configured_axes = ("X", "Y", "Z", "U")
+            self._axis_limits = ((0, 200), (0, 200), (0, 200), (0, 200))
+        else:
+            axes_data = self._retry_json(lambda: self._query_model("move.axes"))["result"]
+            self._configured_axes = tuple(axis["letter"] for axis in axes_data)
+            self._axis_limits = tuple((axis["min"], axis["max"]) for axis in axes_data)
+        self._axis_limits_by_letter = dict(zip(self._configured_axes, self._axis_limits))
+        self._xyz_limits = np.array(
+            [self._axis_limits_by_letter.get(axis, (-np.inf, np.inf)) for axis in ("X", "Y", "Z")], dtype=float
+        )
+
+    def invalidate_axis_cache(self) -> None:
+        """
+        Drop the cached axis letters and limits, e.g. after changing them with M208/M584.
+        The next call that needs them queries the machine again.
+        """
+        self._configured_axes = None
+        self._axis_limits = None
+        self._axis_limits_by_letter = {}
+        self._xyz_limits = None
+
     def get_configured_axes(self):
-        """Fetch and return the list of configured axis letters. In simulation, returns dummy axes."""
+        """Return the cached tuple of configured axis letters. In simulation, returns dummy axes."""
         if self.simulated:
-            return ["X", "Y", "Z", "U"]
-        axes_data = self._retry_json(lambda: self.gcode('M409 K"move.axes[]"'))["result"]
-        return [axis["letter"] for axis in axes_data]
+            return ("X", "Y", "Z", "U")
+        if self._configured_axes is None:
+            self._refresh_axes_config()
+        return self._configured_axes
 
     def get_axis_limits(self):
-        """Fetch and return list of (min, max) tuples for each axis. In simulation, returns dummy limits."""
+        """Return the cached tuple of (min, max) pairs for each axis. In simulation, returns dummy limits."""
         if self.simulated:
-            return [(0, 200), (0, 200), (0, 200), (0, 200)]
-        axes_data = self._retry_json(lambda: self.gcode('M409 K"move.axes"'))["result"]
-        return [(axis["min"], axis["max"]) for axis in axes_data]
+            return ((0, 200), (0, 200), (0, 200), (0, 200))
+        if self._axis_limits is None:
+            self._refresh_axes_config()
+        return self._axis_limits
 
     def get_position(self):
         """
         Get the current position of the machine control point in millimeters.
-        In simulation, returns dummy position.
+        Reads the user positions (the values M114 reports) from the object model in a
+        single M409 query. In simulation, returns dummy position.
         """
         if self.simulated:
             return {"X": 0.0, "Y": 0.0, "Z": 0.0, "U": 0.0}
-        max_tries = 50
-        for _ in range(max_tries):
-            response = self.gcode("M114")
-            if "Count" in response:
-                break
-            time.sleep(0.05)
-        else:
-            logger.error("Failed to get valid position response after max retries.")
-            raise JubileeCommunicationError("Failed to get valid position response after max retries.")
+        return dict(self._read_position())
+
+    def get_position_xyz(self) -> tuple[float, float, float]:
+        """
+        Get the current X, Y, Z machine position as a tuple, without building a position dict
+        for the caller. Missing axes read as 0.0. In simulation, returns the origin.
+        """
+        if self.simulated:
+            return (0.0, 0.0, 0.0)
+        position = self._read_position()
+        return (position.get("X", 0.0), position.get("Y", 0.0), position.get("Z", 0.0))
+
+    @in_order
+    def _read_position(self) -> dict[str, float]:
+        """
+        Query the user position of every axis, store it in the position cache and return the cached dict.
+        """
         try:
-            response = response.split(" Count ", 1)[0]
-        except IndexError:
-            logger.error("Unexpected response format, missing 'Count' keyword.")
-            raise JubileeCommunicationError("Unexpected response format, missing 'Count' keyword.")
-        positions = {}
-        for element in response.split():
-            if ":" in element:
-                axis, pos_str = element.split(":", 1)
-                try:
-                    positions[axis] = float(pos_str)
-                except ValueError:
-                    logger.warning(f"Invalid position value for axis {axis}: {pos_str}")
-                    positions[axis] = None
-        return positions
+            positions = self._retry_json(lambda: self._query_model("move.axes[].userPosition"))["result"]
+        except TimeoutError as e:
+            logger.error("Failed to get valid position response after max retries.")
+            raise JubileeCommunicationError("Failed to get valid position response after max retries.") from e
+        self._position_cache = dict(zip(self.get_configured_axes(), positions))
+        return self._position_cache
 
     def get_endstops(self):
         """
@@ -908,10 +1603,5 @@ class JubileeController:
         if self.simulated:
             return {"X": "open", "Y": "open", "Z": "open", "U": "open"}
         response = self.gcode("M119")
-        states = {}
-        for line in response.splitlines():
-            if ":" in line:
-                name, state = line.split(":", 1)
-                states[name.strip()] = state.strip()
-        return states
+        return dict(_ENDSTOP_RE.findall(response))
 
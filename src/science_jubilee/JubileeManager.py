@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from functools import wraps
 from typing import Tuple, Optional
 
@@ -18,6 +20,49 @@ from science_jubilee.utils.logger_utils import setup_logging
 
 logger = setup_logging(logger_name="JubileeManager")
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TRACKED TOOL OFFSETS
+# ═══════════════════════════════════════════════════════════════════════════════
+class _OffsetDict(dict):
+    """
+    dict of tool offsets that calls on_change after every write, so that item assignments
+    through JubileeManager.tool_offsets also invalidate the manager's cached state.
+    """
+    def __init__(self, on_change, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CLASS JubileeManager
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -29,7 +74,19 @@ class JubileeManager:
     - Manage the deck
     - Manage up to MAX_TOOLS tools and keep track of the active tool
     - Apply tool offsets automatically during movements
+
+    Instances use __slots__: subclasses that add attributes must declare their own __slots__
+    (or omit it to get a per-instance __dict__).
     """
+
+    # _tool_offsets and _active_tool_index back the properties of the same public name
+    __slots__ = (
+        "controller", "simulated", "deck", "MAX_TOOLS", "tools_list", "_tool_offsets", "_active_tool_index",
+        "_loaded_count", "_tool_to_index", "_name_to_index", "_z_park_cache", "_status_cache", "_state_dirty",
+    )
+
+    _ZERO_OFFSET: Tuple[float, float, float] = (0.0, 0.0, 0.0)  # Offset of a tool without a configured offset
+
     # ═══════════════════════════════════════════════════════════════════════════
     # INITIALIZATION
     # ═══════════════════════════════════════════════════════════════════════════
@@ -51,10 +108,17 @@ class JubileeManager:
             controller (JubileeController): Low-level controller instance.
             deck (Deck | None): Loaded deck object.
             MAX_TOOLS (int): Maximum number of tool slots.
-            tools_list (dict[int, Tool | None]): Tool slots.
+            tools_list (list[Tool | None]): Tool slots, indexed 0 to MAX_TOOLS-1.
             tool_offsets (dict[int, tuple[float, float, float]]): Tool offsets.
             active_tool_index (int | None): Index of the currently active tool.
             simulated (bool): Simulation mode flag.
+            _loaded_count (int): Number of loaded tools.
+            _tool_to_index (dict[int, int]): Index of each loaded tool, keyed by id(tool).
+            _name_to_index (dict[str, int]): Index of each loaded tool, keyed by name (names are unique).
+                Rebuilt by _index_of_name when a tool was renamed after loading.
+            _z_park_cache (dict[int, tuple[float, float]]): (deck Z offset, parking Z) per tool index.
+            _status_cache (dict | None): Last summary built by status().
+            _state_dirty (bool): True when the state changed since _status_cache was built.
         """
         if controller is not None:
             self.controller = controller
@@ -67,10 +131,62 @@ class JubileeManager:
         self.simulated: bool = simulated
         self.deck: Optional[Deck] = None
         self.MAX_TOOLS: int = max_tools
-        self.tools_list: dict[int, Optional[Tool]] = {i: None for i in range(self.MAX_TOOLS)}
-        self.tool_offsets: dict[int, tuple[float, float, float]] = {}
-        self.active_tool_index: Optional[int] = None
-        logger.info(f"JubileeManager initialized (simulated={simulated}, max_tools={self.MAX_TOOLS}).")  
+        self.tools_list: list[Optional[Tool]] = [None] * self.MAX_TOOLS
+        self._tool_offsets = _OffsetDict(self._offsets_changed)
+        self._active_tool_index: Optional[int] = None
+        # Lookup indexes kept in sync by _place_tool/_remove_tool
+        self._loaded_count: int = 0
+        self._tool_to_index: dict[int, int] = {}
+        self._name_to_index: dict[str, int] = {}
+        # Parking Z per tool, dropped on any tool offset write and checked against the live deck Z
+        self._z_park_cache: dict[int, tuple[float, float]] = {}
+        # status() memo, rebuilt only after a mutation flips _state_dirty
+        self._status_cache: Optional[dict] = None
+        self._state_dirty: bool = True
+        logger.info("JubileeManager initialized (simulated=%s, max_tools=%s).", simulated, self.MAX_TOOLS)
+
+    @property
+    def active_tool_index(self) -> Optional[int]:
+        """
+        Return the index of the currently active tool, or None.
+        """
+        return self._active_tool_index
+
+    @active_tool_index.setter
+    def active_tool_index(self, index: Optional[int]) -> None:
+        """
+        Set the active tool index and invalidate the cached status.
+        """
+        self._active_tool_index = index
+        self._invalidate_state()
+
+    @property
+    def tool_offsets(self) -> dict[int, tuple[float, float, float]]:
+        """
+        Return the tool offsets, keyed by tool index. Item writes invalidate the cached status.
+        """
+        return self._tool_offsets
+
+    @tool_offsets.setter
+    def tool_offsets(self, offsets: dict[int, tuple[float, float, float]]) -> None:
+        """
+        Replace all tool offsets and invalidate the cached status.
+        """
+        self._tool_offsets = _OffsetDict(self._offsets_changed, offsets)
+        self._offsets_changed()
+
+    def _invalidate_state(self) -> None:
+        """
+        Mark the cached status as stale. Called on every write to active_tool_index or tool_offsets.
+        """
+        self._state_dirty = True
+
+    def _offsets_changed(self) -> None:
+        """
+        Drop the parking Z cache and invalidate the cached status after a tool offset write.
+        """
+        self._z_park_cache.clear()
+        self._invalidate_state()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # DECK MANAGEMENT
@@ -92,7 +208,8 @@ class JubileeManager:
             raise DeckStateError("Deck already loaded. Unload first.")
         try:
             self.deck = Deck(deck_filename, path)
-            logger.info(f"Deck '{self.deck.name}' loaded from '{self.deck.path}'.")
+            self._state_dirty = True
+            logger.info("Deck '%s' loaded from '%s'.", self.deck.name, self.deck.path)
             return self.deck
         except Exception as e:
             logger.error(f"Failed to load deck '{deck_filename}': {e}")
@@ -124,8 +241,9 @@ class JubileeManager:
         if self.deck is None:
             logger.error("No deck loaded.")
             raise DeckStateError("No deck loaded.")
-        logger.info(f"Unloading deck '{self.deck.name}'.")
+        logger.info("Unloading deck '%s'.", self.deck.name)
         self.deck = None
+        self._state_dirty = True
 
     def is_deck_loaded(self) -> bool:
         """
@@ -145,23 +263,32 @@ class JubileeManager:
             tool (Tool): Tool instance to load.
             index (int): Fixed index (0 to MAX_TOOLS-1) where to place the tool.
         Raises:
-            ToolStateError: If a tool is already loaded at this index or the tool is already loaded elsewhere.
+            ToolStateError: If a tool is already loaded at this index, the tool is already loaded elsewhere,
+                or another loaded tool has the same name.
             ToolConfigurationError: If the index is out of bounds or the tool limit is exceeded.
         """
         if not (0 <= index < self.MAX_TOOLS):
-            logger.error(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-            raise ToolConfigurationError(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-        if index in self.tools_list and self.tools_list[index] is not None:
-            logger.error(f"A tool is already loaded at index {index}.")
-            raise ToolStateError(f"A tool is already loaded at index {index}.")
-        if any(t is tool for t in self.tools_list.values() if t is not None):
+            msg = f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1})."
+            logger.error(msg)
+            raise ToolConfigurationError(msg)
+        if self.tools_list[index] is not None:
+            msg = f"A tool is already loaded at index {index}."
+            logger.error(msg)
+            raise ToolStateError(msg)
+        if id(tool) in self._tool_to_index:
             logger.error(f"This tool object is already loaded at another index.")
             raise ToolStateError("This tool object is already loaded at another index.")
-        if len([t for t in self.tools_list.values() if t is not None]) >= self.MAX_TOOLS:
-            logger.error(f"Cannot load more than {self.MAX_TOOLS} tools.")
-            raise ToolConfigurationError(f"Cannot load more than {self.MAX_TOOLS} tools.")
-        self.tools_list[index] = tool
-        logger.info(f"Tool '{tool.name}' loaded at index {index}.")
+        idx = self._index_of_name(getattr(tool, 'name', None))
+        if idx is not None:
+            msg = f"A tool named '{tool.name}' is already loaded at index {idx}."
+            logger.error(msg)
+            raise ToolStateError(msg)
+        if self._loaded_count >= self.MAX_TOOLS:
+            msg = f"Cannot load more than {self.MAX_TOOLS} tools."
+            logger.error(msg)
+            raise ToolConfigurationError(msg)
+        self._place_tool(index, tool)
+        logger.info("Tool '%s' loaded at index %s.", tool.name, index)
 
     def change_tool(self, tool: Tool, index: int) -> None:
         """
@@ -172,21 +299,31 @@ class JubileeManager:
             index (int): Fixed index (0 to MAX_TOOLS-1).
         Raises:
             ToolConfigurationError: If the index is out of bounds.
-            ToolStateError: If no tool is loaded at this index, or if the tool is already loaded at any index.
+            ToolStateError: If no tool is loaded at this index, if the tool is already loaded at any index,
+                or if a tool with the same name is loaded at another index.
         """
         if not (0 <= index < self.MAX_TOOLS):
-            logger.error(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-            raise ToolConfigurationError(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-        if self.tools_list.get(index) is None:
-            logger.error(f"No tool to replace at index {index}.")
-            raise ToolStateError(f"No tool to replace at index {index}.")
-        for idx, t in self.tools_list.items():
-            if t is tool:
-                logger.error(f"This tool object is already loaded at index {idx}. Cannot change tool at index {index}.")
-                raise ToolStateError(f"This tool object is already loaded at index {idx}. Cannot change tool at index {index}.")
+            msg = f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1})."
+            logger.error(msg)
+            raise ToolConfigurationError(msg)
+        if self.tools_list[index] is None:
+            msg = f"No tool to replace at index {index}."
+            logger.error(msg)
+            raise ToolStateError(msg)
+        idx = self._tool_to_index.get(id(tool))
+        if idx is not None:
+            msg = f"This tool object is already loaded at index {idx}. Cannot change tool at index {index}."
+            logger.error(msg)
+            raise ToolStateError(msg)
+        idx = self._index_of_name(getattr(tool, 'name', None))
+        if idx is not None and idx != index:
+            msg = f"A tool named '{tool.name}' is already loaded at index {idx}. Cannot change tool at index {index}."
+            logger.error(msg)
+            raise ToolStateError(msg)
         old_tool_name = self.tools_list[index].name
-        self.tools_list[index] = tool
-        logger.info(f"Tool '{old_tool_name}' replaced by '{tool.name}' at index {index}.")
+        self._remove_tool(index)
+        self._place_tool(index, tool)
+        logger.info("Tool '%s' replaced by '%s' at index %s.", old_tool_name, tool.name, index)
 
     def unload_tool(self, index: int) -> None:
         """
@@ -197,38 +334,103 @@ class JubileeManager:
             ToolStateError: If no tool is loaded at this index.
         """
         if not self.is_tool_loaded(index):
-            logger.error(f"No tool loaded at index {index} to unload.")
-            raise ToolStateError(f"No tool loaded at index {index} to unload.")
+            msg = f"No tool loaded at index {index} to unload."
+            logger.error(msg)
+            raise ToolStateError(msg)
         tool_name = self.tools_list[index].name
-        self.tools_list[index] = None
+        self._remove_tool(index)
         if index in self.tool_offsets:
             del self.tool_offsets[index]
         if self.active_tool_index == index:
             self.active_tool_index = None
-            logger.info(f"Active tool at index {index} was unloaded. No active tool now.")
-        logger.info(f"Tool '{tool_name}' unloaded from index {index}.")
+            logger.info("Active tool at index %s was unloaded. No active tool now.", index)
+        logger.info("Tool '%s' unloaded from index %s.", tool_name, index)
 
-    def unload_all_tools(self) -> None:
+    def unload_all_tools(self) -> int:
         """
-        Unload all tools from the machine.
+        Unload all tools from the machine. Does nothing if no tool is loaded.
+        Returns:
+            int: Number of tools unloaded.
+        """
+        if not self._loaded_count:
+            logger.debug("No tools to unload.")
+            return 0
+        unloaded = []
+        for idx, tool in enumerate(self.tools_list):
+            if tool is not None:
+                unloaded.append((idx, tool.name))
+                self._remove_tool(idx)
+                if idx in self.tool_offsets:
+                    del self.tool_offsets[idx]
+        active = ""
+        if self.active_tool_index is not None:
+            active = f" Active tool at index {self.active_tool_index} was unloaded. No active tool now."
+            self.active_tool_index = None
+        # One record for the whole batch instead of one per slot
+        logger.info("Unloaded %s tool(s): %s.%s", len(unloaded), ", ".join(f"'{name}' from index {idx}" for idx, name in unloaded), active)
+        return len(unloaded)
+
+    def unload_all_tools_strict(self) -> int:
+        """
+        Unload all tools from the machine, raising if none is loaded.
+        Returns:
+            int: Number of tools unloaded.
         Raises:
             ToolStateError: If no tools are loaded.
         """
-        unloaded_any = False
-        for idx in list(self.tools_list.keys()):
-            if self.tools_list[idx] is not None:
-                tool_name = self.tools_list[idx].name
-                self.tools_list[idx] = None
-                if idx in self.tool_offsets:
-                    del self.tool_offsets[idx]
-                if self.active_tool_index == idx:
-                    self.active_tool_index = None
-                    logger.info(f"Active tool at index {idx} was unloaded. No active tool now.")
-                logger.info(f"Tool '{tool_name}' unloaded from index {idx}.")
-                unloaded_any = True
-        if not unloaded_any:
+        if not self._loaded_count:
             logger.warning("No tools to unload.")
             raise ToolStateError("No tools to unload.")
+        return self.unload_all_tools()
+
+    def _place_tool(self, index: int, tool: Tool) -> None:
+        """
+        Put a tool in an empty slot and add it to the lookup indexes.
+        """
+        self.tools_list[index] = tool
+        self._loaded_count += 1
+        self._state_dirty = True
+        self._tool_to_index[id(tool)] = index
+        name = getattr(tool, 'name', None)
+        if name is not None:
+            self._name_to_index[name] = index
+
+    def _remove_tool(self, index: int) -> None:
+        """
+        Empty a loaded slot and drop its tool from the lookup indexes.
+        """
+        tool = self.tools_list[index]
+        self.tools_list[index] = None
+        self._loaded_count -= 1
+        self._state_dirty = True
+        del self._tool_to_index[id(tool)]
+        self._name_to_index.pop(getattr(tool, 'name', None), None)
+
+    def _index_of_name(self, name: Optional[str]) -> Optional[int]:
+        """
+        Return the index of the loaded tool with this name, or None.
+        Tool names can be changed after loading, so a hit is checked against the tool's current
+        name, and a miss rebuilds the index from the slots before giving up.
+        """
+        if name is None:
+            return None
+        idx = self._name_to_index.get(name)
+        if idx is not None:
+            tool = self.tools_list[idx]
+            if tool is not None and getattr(tool, 'name', None) == name:
+                return idx
+        self._name_to_index = {
+            tool.name: i for i, tool in enumerate(self.tools_list)
+            if tool is not None and getattr(tool, 'name', None) is not None
+        }
+        return self._name_to_index.get(name)
+
+    def _loaded(self, index: int) -> bool:
+        """
+        Return True if a tool is loaded at an index already known to be in range
+        (e.g. active_tool_index). Public callers go through is_tool_loaded().
+        """
+        return self.tools_list[index] is not None
 
     def is_tool_loaded(self, index: int) -> bool:
         """
@@ -241,9 +443,10 @@ class JubileeManager:
             ToolConfigurationError: If the index is out of bounds.
         """
         if not (0 <= index < self.MAX_TOOLS):
-            logger.error(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-            raise ToolConfigurationError(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-        return self.tools_list.get(index) is not None
+            msg = f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1})."
+            logger.error(msg)
+            raise ToolConfigurationError(msg)
+        return self.tools_list[index] is not None
 
     def get_loaded_tools(self) -> list[dict]:
         """
@@ -253,7 +456,7 @@ class JubileeManager:
         """
         return [
             {'index': idx, 'name': tool.name}
-            for idx, tool in self.tools_list.items() if tool is not None
+            for idx, tool in enumerate(self.tools_list) if tool is not None
         ]
 
     def get_tool(self, index: int) -> dict:
@@ -268,13 +471,15 @@ class JubileeManager:
             ToolStateError: If no tool is loaded at this index.
         """
         if not (0 <= index < self.MAX_TOOLS):
-            logger.error(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-            raise ToolConfigurationError(f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1}).")
-        tool = self.tools_list.get(index)
+            msg = f"Tool index {index} out of bounds (0-{self.MAX_TOOLS-1})."
+            logger.error(msg)
+            raise ToolConfigurationError(msg)
+        tool = self.tools_list[index]
         if tool is not None:
             return {'index': index, 'name': tool.name, 'tool': tool}
-        logger.error(f"No tool loaded at index {index}.")
-        raise ToolStateError(f"No tool loaded at index {index}.")
+        msg = f"No tool loaded at index {index}."
+        logger.error(msg)
+        raise ToolStateError(msg)
 
     def get_tool_by_name(self, tool_name: str) -> dict:
         """
@@ -286,11 +491,12 @@ class JubileeManager:
         Raises:
             ToolStateError: If no tool with this name is loaded.
         """
-        for idx, tool in self.tools_list.items():
-            if tool is not None and getattr(tool, 'name', None) == tool_name:
-                return {'index': idx, 'name': tool.name, 'tool': tool}
-        logger.error(f"No tool loaded with name '{tool_name}'.")
-        raise ToolStateError(f"No tool loaded with name '{tool_name}'.")
+        idx = self._index_of_name(tool_name)
+        if idx is not None:
+            return {'index': idx, 'name': tool_name, 'tool': self.tools_list[idx]}
+        msg = f"No tool loaded with name '{tool_name}'."
+        logger.error(msg)
+        raise ToolStateError(msg)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # TOOL OFFSETS
@@ -305,10 +511,11 @@ class JubileeManager:
             ToolStateError: If no tool is loaded at this index.
         """
         if not self.is_tool_loaded(index):
-            logger.error(f"No tool loaded at index {index} to set offset.")
-            raise ToolStateError(f"No tool loaded at index {index} to set offset.")
+            msg = f"No tool loaded at index {index} to set offset."
+            logger.error(msg)
+            raise ToolStateError(msg)
         self.tool_offsets[index] = offset
-        logger.info(f"Offset for tool at index {index} set to {offset}.")
+        logger.info("Offset for tool at index %s set to %s.", index, offset)
 
     def get_tool_offset(self, index: int) -> tuple[float, float, float]:
         """
@@ -321,9 +528,10 @@ class JubileeManager:
             ToolStateError: If no tool is loaded at this index.
         """
         if not self.is_tool_loaded(index):
-            logger.error(f"No tool loaded at index {index} to get offset.")
-            raise ToolStateError(f"No tool loaded at index {index} to get offset.")
-        return self.tool_offsets.get(index, (0.0, 0.0, 0.0))
+            msg = f"No tool loaded at index {index} to get offset."
+            logger.error(msg)
+            raise ToolStateError(msg)
+        return self.tool_offsets.get(index, self._ZERO_OFFSET)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ACTIVE TOOL MANAGEMENT
@@ -337,10 +545,11 @@ class JubileeManager:
             ToolStateError: If no tool is loaded at this index.
         """
         if not self.is_tool_loaded(index):
-            logger.error(f"No tool loaded at index {index} to set as active.")
-            raise ToolStateError(f"No tool loaded at index {index} to set as active.")
+            msg = f"No tool loaded at index {index} to set as active."
+            logger.error(msg)
+            raise ToolStateError(msg)
         self.active_tool_index = index
-        logger.info(f"Tool at index {index} set as active tool.")
+        logger.info("Tool at index %s set as active tool.", index)
 
     def set_active_tool_by_name(self, tool_name: str) -> None:
         """
@@ -350,13 +559,14 @@ class JubileeManager:
         Raises:
             ToolStateError: If no tool with this name is loaded.
         """
-        for idx, tool in self.tools_list.items():
-            if tool is not None and getattr(tool, 'name', None) == tool_name:
-                self.active_tool_index = idx
-                logger.info(f"Tool '{tool_name}' at index {idx} set as active tool.")
-                return
-        logger.error(f"No tool loaded with name '{tool_name}' to set as active.")
-        raise ToolStateError(f"No tool loaded with name '{tool_name}' to set as active.")
+        idx = self._index_of_name(tool_name)
+        if idx is not None:
+            self.active_tool_index = idx
+            logger.info("Tool '%s' at index %s set as active tool.", tool_name, idx)
+            return
+        msg = f"No tool loaded with name '{tool_name}' to set as active."
+        logger.error(msg)
+        raise ToolStateError(msg)
 
     def get_active_tool(self) -> tuple[Optional[int], Optional[object]]:
         """
@@ -365,7 +575,7 @@ class JubileeManager:
             tuple: (index, tool) if active tool is set, else (None, None)
         """
         idx = self.active_tool_index
-        if idx is not None and self.is_tool_loaded(idx):
+        if idx is not None and self._loaded(idx):
             return idx, self.tools_list[idx]
         return None, None
 
@@ -378,18 +588,15 @@ class JubileeManager:
             ToolStateError: If no active tool is set.
         """
         idx = self.active_tool_index
-        if idx is None or not self.is_tool_loaded(idx):
+        if idx is None or not self._loaded(idx):
             logger.error("No active tool to get position.")
             raise ToolStateError("No active tool to get position.")
-        # Get the machine position as a dict and apply the tool offset
-        machine_pos = self.controller.get_position()
-        offset = self.get_tool_offset(idx)
-        workspace_pos = (
-            machine_pos.get("X", 0.0) - offset[0],
-            machine_pos.get("Y", 0.0) - offset[1],
-            machine_pos.get("Z", 0.0) - offset[2],
-        )
-        logger.info(f"Active tool at index {idx} workspace position: {workspace_pos} (machine: {machine_pos}, offset: {offset})")
+        # Get the machine position and apply the tool offset
+        machine_pos = self.controller.get_position_xyz()
+        mx, my, mz = machine_pos
+        ox, oy, oz = offset = self.tool_offsets.get(idx, self._ZERO_OFFSET)
+        workspace_pos = (mx - ox, my - oy, mz - oz)
+        logger.info("Active tool at index %s workspace position: %s (machine: %s, offset: %s)", idx, workspace_pos, machine_pos, offset)
         return workspace_pos
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -410,15 +617,12 @@ class JubileeManager:
         if not self.is_tool_loaded(index):
             logger.error(f"Cannot pick up tool {index}: no tool loaded at this index.")
             raise ToolStateError(f"No tool loaded at index {index} to pick up.")
-        # Calcul dynamique du Z pour la prise d'outil
-        z_deck = self.deck.deck_offset[2] if self.deck and len(self.deck.deck_offset) > 2 else 0.0
-        z_tool = self.get_tool_offset(index)[2] if index in self.tool_offsets else 0.0
-        z_park = z_deck + z_tool
-        logger.info(f"pickup_tool: Using Z={z_park} (deck offset {z_deck} + tool offset {z_tool}) for tool {index}.")
+        z_park = self._compute_z_park(index)
+        logger.info("pickup_tool: Using Z=%s for tool %s.", z_park, index)
         # On suppose que la séquence du controller accepte un paramètre z_park (sinon il faut l'ajouter)
         self.controller.pickup_tool_sequence(index, speed=speed, z_park=z_park)
         self.active_tool_index = index
-        logger.info(f"Tool at index {index} picked up and set as active.")
+        logger.info("Tool at index %s picked up and set as active.", index)
 
     def park_active_tool(self, speed: float = 6000) -> None:
         """
@@ -432,13 +636,39 @@ class JubileeManager:
             logger.error("No active tool to park.")
             raise ToolStateError("No active tool to park.")
         index = self.active_tool_index
-        z_deck = self.deck.deck_offset[2] if self.deck and len(self.deck.deck_offset) > 2 else 0.0
-        z_tool = self.get_tool_offset(index)[2] if index in self.tool_offsets else 0.0
-        z_park = z_deck + z_tool
-        logger.info(f"park_active_tool: Using Z={z_park} (deck offset {z_deck} + tool offset {z_tool}) for tool {index}.")
+        z_park = self._compute_z_park(index)
+        logger.info("park_active_tool: Using Z=%s for tool %s.", z_park, index)
         self.controller.park_tool_sequence(index, speed=speed, z_park=z_park)
         self.active_tool_index = None
-        logger.info(f"Tool at index {index} parked and no longer active.")
+        logger.info("Tool at index %s parked and no longer active.", index)
+
+    def _compute_z_park(self, index: int) -> float:
+        """
+        Compute the parking Z of a tool (deck Z offset + tool Z offset).
+        The result is cached per tool. An entry is only reused while the deck Z offset it was
+        computed with is still current, and tool offset writes clear the cache, so changing
+        either offset takes effect on the next tool change.
+        """
+        z_deck = self._deck_z()
+        cached = self._z_park_cache.get(index)
+        if cached is not None and cached[0] == z_deck:
+            return cached[1]
+        z_tool = self.tool_offsets[index][2] if index in self.tool_offsets else 0.0
+        z_park = z_deck + z_tool
+        self._z_park_cache[index] = (z_deck, z_park)
+        logger.debug("Parking Z for tool %s: deck offset %s + tool offset %s = %s.", index, z_deck, z_tool, z_park)
+        return z_park
+
+    def _deck_z(self) -> float:
+        """
+        Return the Z component of the loaded deck's current offset (0.0 without a deck or with a 2D offset).
+        Not cached: the offset can be changed through Deck.deck_offset at any time, and reading it
+        is as cheap as checking a cached copy would be.
+        """
+        if self.deck is None:
+            return 0.0
+        offset = self.deck.deck_offset
+        return offset[2] if len(offset) > 2 else 0.0
 
     # ═══════════════════════════════════════════════════════════════════════════
     # HIGH-LEVEL MACHINE CONTROL
@@ -467,16 +697,18 @@ class JubileeManager:
             ToolStateError: If no active tool is set.
         """
         idx = self.active_tool_index
-        if idx is None or not self.is_tool_loaded(idx):
+        if idx is None or not self._loaded(idx):
             logger.error("No active tool to move.")
             raise ToolStateError("No active tool to move.")
-        offset = self.get_tool_offset(idx)
+        ox, oy, oz = offset = self.tool_offsets.get(idx, self._ZERO_OFFSET)
         # Only add offset to axes that are not None
-        target_x = x + offset[0] if x is not None else None
-        target_y = y + offset[1] if y is not None else None
-        target_z = z + offset[2] if z is not None else None
+        target_x, target_y, target_z = (
+            None if x is None else x + ox,
+            None if y is None else y + oy,
+            None if z is None else z + oz,
+        )
         # U is not offset by default, but you can adapt if needed
-        logger.info(f"Moving active tool at index {idx} to (x={x}, y={y}, z={z}, u={u}) with offset {offset} (machine position: {target_x}, {target_y}, {target_z}, {u}).")
+        logger.info("Moving active tool at index %s to (x=%s, y=%s, z=%s, u=%s) with offset %s (machine position: %s, %s, %s, %s).", idx, x, y, z, u, offset, target_x, target_y, target_z, u)
         self.controller.move_to(x=target_x, y=target_y, z=target_z, u=u, s=s, param=param, wait=wait)
 
     def move_active_tool_to_well(
@@ -500,23 +732,44 @@ class JubileeManager:
         Raises:
             ToolStateError, DeckStateError: If required info is missing.
         """
-        if self.deck is None:
+        # Validate the active tool and fetch its offset once, then talk to the controller directly
+        idx = self.active_tool_index
+        if idx is None or not self._loaded(idx):
+            logger.error("No active tool to move.")
+            raise ToolStateError("No active tool to move.")
+        ox, oy, oz = self.tool_offsets.get(idx, self._ZERO_OFFSET)
+        wx, wy, wz = self._well_machine_xyz(slot_index, well_name)
+        machine_x = wx + x_offset + ox
+        machine_y = wy + y_offset + oy
+        machine_z = wz + z_offset + oz
+        logger.info("Moving active tool at index %s to slot %s, well %s at machine position (x=%s, y=%s, z=%s)", idx, slot_index, well_name, machine_x, machine_y, machine_z)
+        self.controller.move_to(x=machine_x, y=machine_y, z=machine_z, s=s, wait=wait)
+
+    def _well_machine_xyz(self, slot_index: str, well_name: str) -> tuple[float, float, float]:
+        """
+        Resolve the machine (x, y, z) of a well with a single slot lookup (slot origin + deck offset + well coordinates).
+        Raises:
+            DeckStateError: If no deck is loaded, the slot has no labware, or the well does not exist.
+        """
+        deck = self.deck
+        if deck is None:
             logger.error("No deck loaded to move to well.")
             raise DeckStateError("No deck loaded.")
-        slot = self.deck.get_slot(slot_index)
+        slot = deck.get_slot(slot_index)
         if not slot.has_labware or not hasattr(slot.labware, 'get_well_coordinates'):
-            logger.error(f"No labware with well coordinates loaded in slot {slot_index}.")
-            raise DeckStateError(f"No labware with well coordinates loaded in slot {slot_index}.")
-        well_coords = slot.labware.get_well_coordinates(well_name)
-        if well_coords is None or len(well_coords) < 2:
-            logger.error(f"Well {well_name} not found in labware at slot {slot_index}.")
-            raise DeckStateError(f"Well {well_name} not found in labware at slot {slot_index}.")
-        x_slot, y_slot = self.deck.get_slot_machine_coordinates(slot_index)
-        x = x_slot + well_coords[0] + x_offset
-        y = y_slot + well_coords[1] + y_offset
-        z = self.get_machine_z(slot_index, well_name) + z_offset
-        logger.info(f"Moving active tool to slot {slot_index}, well {well_name} at machine position (x={x}, y={y}, z={z})")
-        self.move_active_tool_effector_to(x=x, y=y, z=z, s=s, wait=wait)
+            msg = f"No labware with well coordinates loaded in slot {slot_index}."
+            logger.error(msg)
+            raise DeckStateError(msg)
+        try:
+            wx, wy, wz = slot.labware.get_well_coordinates(well_name)
+        except (KeyError, TypeError, ValueError):
+            msg = f"Well {well_name} not found in labware at slot {slot_index}."
+            logger.error(msg)
+            raise DeckStateError(msg)
+        x_slot, y_slot = slot.coordinates
+        # Read the offset now: it can be changed through Deck.deck_offset after the deck is loaded
+        ox, oy = deck.deck_offset[:2]
+        return (x_slot + ox + wx, y_slot + oy + wy, self._deck_z() + wz)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # MANAGER STATE & RESET
@@ -524,30 +777,45 @@ class JubileeManager:
     def status(self) -> dict:
         """
         Return a summary of the current state of the manager.
+        The summary is cached and only rebuilt after the state changed; each call returns
+        fresh containers, so callers may modify the result.
         Returns:
             dict: Summary with deck, loaded tools, active tool, and offsets.
         """
-        deck_info = self.deck.name if self.deck else None
-        loaded_tools = self.get_loaded_tools()
-        active_idx, active_tool = self.get_active_tool()
+        if self._state_dirty or self._status_cache is None:
+            deck_info = self.deck.name if self.deck else None
+            active_idx, active_tool = self.get_active_tool()
+            self._status_cache = {
+                'deck': deck_info,
+                'tools': self.get_loaded_tools(),
+                'active_tool_index': active_idx,
+                'active_tool_name': getattr(active_tool, 'name', None) if active_tool else None,
+                'tool_offsets': self.tool_offsets.copy(),
+            }
+            self._state_dirty = False
+        cache = self._status_cache
         return {
-            'deck': deck_info,
-            'tools': loaded_tools,
-            'active_tool_index': active_idx,
-            'active_tool_name': getattr(active_tool, 'name', None) if active_tool else None,
-            'tool_offsets': self.tool_offsets.copy(),
+            **cache,
+            'tools': [dict(tool) for tool in cache['tools']],
+            'tool_offsets': cache['tool_offsets'].copy(),
         }
 
     def reset(self) -> None:
         """
         Reset the manager: unload all tools, unload deck, reset active tool and offsets.
+        All containers are cleared in bulk and a single record is logged.
         """
-        self.unload_all_tools()
-        if self.deck is not None:
-            self.unload_deck()
-        self.active_tool_index = None
+        loaded = self._loaded_count
+        deck_name = self.deck.name if self.deck is not None else None
+        self.tools_list[:] = [None] * self.MAX_TOOLS
         self.tool_offsets.clear()
-        logger.info("JubileeManager reset: all tools and deck unloaded, offsets cleared.")
+        self._loaded_count = 0
+        self._tool_to_index.clear()
+        self._name_to_index.clear()
+        self.active_tool_index = None
+        self.deck = None
+        self._state_dirty = True
+        logger.info("JubileeManager reset: unloaded %s tool(s) and deck %s, offsets cleared.", loaded, deck_name)
         
         
         
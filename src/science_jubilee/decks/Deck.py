@@ -1,18 +1,60 @@
-import json
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Dict, Tuple, Optional, Any
 
+try:
+    from orjson import loads as _json_loads  # Optional: faster parsing of deck files
+except ImportError:
+    from json import loads as _json_loads
+
 from science_jubilee.labware.Labware import Labware
-from science_jubilee.utils.exceptions import (DeckError, DeckStateError, DeckConfigurationError, DeckNotFoundError, DeckOccupiedError, DeckEmptyError)
+from science_jubilee.utils.exceptions import (DeckStateError, DeckConfigurationError, DeckNotFoundError, DeckOccupiedError, DeckEmptyError)
 from science_jubilee.utils.logger_utils import setup_logging
 
 logger = setup_logging(logger_name="Deck")
 
+# Fields that must be present (not None) for each slot shape
+_SHAPE_REQUIREMENTS = {"rectangle": ("width", "length"), "circle": ("diameter",)}
+
+@lru_cache(maxsize=64)
+def _resolve_deck_path(deck_filename: str, path: Optional[str]) -> Tuple[str, str, str]:
+    """
+    Resolve the deck directory, file name (with '.json') and full config path. Pure, so memoized.
+    Relative paths are resolved against this module's directory.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "deck_definition")
+    elif not os.path.isabs(path):
+        path = os.path.abspath(os.path.join(os.path.dirname(__file__), path))
+    else:
+        path = os.path.abspath(path)
+    if not deck_filename.endswith(".json"):
+        deck_filename += ".json"
+    return path, deck_filename, os.path.join(path, deck_filename)
+
+@lru_cache(maxsize=32)
+def _read_deck_file_cached(config_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a deck file. Keyed on the file's mtime and size so an edited file is read again.
+    The raw bytes are cached rather than the parsed dict: parsing gives each Deck its own
+    config to mutate, and is cheaper than deep-copying a cached one.
+    """
+    # Deck files are small: one unbuffered read of the stat'ed size
+    fd = os.open(config_path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════════════
-@dataclass
+# slots=True needs Python 3.10+; older interpreters keep a regular dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Slot:
     """
     Represents a slot on the deck. Supports flexible shapes and coordinates.
@@ -34,6 +76,12 @@ class Slot:
     has_labware: bool = False
     labware: Optional[Any] = None
 
+def _slot_info(slot: Slot) -> dict:
+    """
+    Return the attributes of a slot as a new dict (shallow: the labware object is not copied).
+    """
+    return {f.name: getattr(slot, f.name) for f in fields(slot)}
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SLOT SET
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -49,10 +97,11 @@ class SlotSet:
         return f"<SlotSet: {len(self.slots)} slots>"
  
     def __getitem__(self, id_):
-        try:
-            return self.slots[str(id_)]
-        except KeyError:
+        slots = self.slots
+        slot = slots.get(id_) if isinstance(id_, str) else slots.get(str(id_))
+        if slot is None:
             raise DeckStateError(f"Slot '{id_}' not found in deck.")
+        return slot
 
     def __iter__(self):
         return iter(self.slots.values())
@@ -76,25 +125,15 @@ class Deck(SlotSet):
             DeckNotFoundError: If the deck file does not exist.
             DeckConfigurationError: If the file or its content is invalid.
         """
-        # Determine path
-        if path is None:
-            path = os.path.join(os.path.dirname(__file__), "deck_definition")
-        elif not os.path.isabs(path):
-            path = os.path.abspath(os.path.join(os.path.dirname(__file__), path))
-        else:
-            path = os.path.abspath(path)
-        if not deck_filename.endswith(".json"):
-            deck_filename += ".json"
-        config_path = os.path.join(path, deck_filename)
-        logger.info(f"Loading deck configuration from: {config_path}")
-        if not os.path.exists(config_path):
+        path, deck_filename, config_path = _resolve_deck_path(deck_filename, path)
+        logger.info("Loading deck configuration from: %s", config_path)
+        # The stat that keys the parse cache doubles as the existence check
+        try:
+            st = os.stat(config_path)
+            deck_config = _json_loads(_read_deck_file_cached(config_path, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
             logger.error(f"Deck file not found: {config_path}")
             raise DeckNotFoundError(f"Deck file not found: {config_path}")
-        try:
-            with open(config_path, "r") as f:
-                deck_config = json.load(f)
-        except DeckNotFoundError:
-            raise
         except Exception as e:
             logger.error(f"Failed to load deck config: {e}")
             raise DeckConfigurationError(f"Failed to load deck config: {e}")
@@ -108,7 +147,7 @@ class Deck(SlotSet):
         self.description = deck_config.get("description", "")
         self.deck_type = deck_config.get("type", "")
         
-        self.deck_offset = tuple(deck_config.get("deck_offset", [0.0, 0.0]))
+        self.deck_offset = deck_config.get("deck_offset", [0.0, 0.0])  # Property: also resets _machine_coord_cache
         self.material = deck_config.get("material", {})
         self.slot_reference_corner = deck_config.get("slot_reference_corner", "bottom_left")
         self.safe_z_clearance = deck_config.get("safe_z_clearance", 10.0)
@@ -117,38 +156,56 @@ class Deck(SlotSet):
         
         super().__init__(self.slots)
         
-        logger.info(f"Deck '{self.name}' loaded with {len(self.slots)} slots.")
+        logger.info("Deck '%s' loaded with %s slots.", self.name, len(self.slots))
 
     def _parse_slots(self) -> Dict[str, Slot]:
         """
         Parse the slots from the deck configuration.
+        Also records the slot index tuple returned by list_slots.
         Returns:
             Dict[str, Slot]: Dictionary of slot objects.
         Raises:
-            DeckConfigurationError: If a slot is malformed or missing required fields.
+            DeckConfigurationError: If any slot is malformed or missing required fields
+                (one error listing every invalid slot).
         """
         slots = {}
+        errors = []
         for s, sv in self.slots_data.items():
-            try:
-                slot_kwargs = dict(sv)
-                slot_kwargs.setdefault("slot_index", s)
-                # Ensure coordinates are tuple and present
-                coords = slot_kwargs.get("coordinates")
-                if coords is None:
-                    raise DeckConfigurationError(f"Slot '{s}' missing 'coordinates'.")
+            s = str(s)
+            if not isinstance(sv, dict):
+                errors.append(f"Error parsing slot '{s}': slot definition must be an object.")
+                continue
+            slot_kwargs = dict(sv)
+            slot_kwargs.setdefault("slot_index", s)
+            # Ensure coordinates are tuple and present
+            coords = slot_kwargs.get("coordinates")
+            if coords is None:
+                errors.append(f"Error parsing slot '{s}': Slot '{s}' missing 'coordinates'.")
+                continue
+            if not isinstance(coords, tuple):
+                if not isinstance(coords, list):
+                    errors.append(f"Error parsing slot '{s}': 'coordinates' must be a list.")
+                    continue
                 slot_kwargs["coordinates"] = tuple(coords)
-                # Robustness: check shape and required fields
-                shape = slot_kwargs.get("shape")
-                if shape == "rectangle":
-                    if slot_kwargs.get("width") is None or slot_kwargs.get("length") is None:
-                        raise DeckConfigurationError(f"Rectangle slot '{s}' missing 'width' or 'length'.")
-                elif shape == "circle":
-                    if slot_kwargs.get("diameter") is None:
-                        raise DeckConfigurationError(f"Circle slot '{s}' missing 'diameter'.")
+            # Robustness: check shape and required fields
+            shape = slot_kwargs.get("shape")
+            required = _SHAPE_REQUIREMENTS.get(shape)
+            if required and any(slot_kwargs.get(k) is None for k in required):
+                errors.append(
+                    f"Error parsing slot '{s}': {shape.capitalize()} slot '{s}' missing "
+                    + " or ".join(f"'{k}'" for k in required) + "."
+                )
+                continue
+            try:
                 slots[s] = Slot(**slot_kwargs)
-            except Exception as e:
-                logger.error(f"Error parsing slot '{s}': {e}")
-                raise DeckConfigurationError(f"Error parsing slot '{s}': {e}")
+            except TypeError as e:  # Unknown or missing Slot fields
+                errors.append(f"Error parsing slot '{s}': {e}")
+        if errors:
+            msg = "\n".join(errors)
+            logger.error(msg)
+            raise DeckConfigurationError(msg)
+        # Slot keys never change after parsing (labware load/unload does not add or remove slots)
+        self._slot_keys = tuple(slots)
         return slots
 
     def __repr__(self) -> str:
@@ -162,6 +219,25 @@ class Deck(SlotSet):
     # ═══════════════════════════════════════════════════════════════════════════
     # PROPERTIES
     # ═══════════════════════════════════════════════════════════════════════════
+    @property
+    def deck_offset(self) -> tuple:
+        """
+        Return the deck offset from the machine origin.
+        Returns:
+            tuple: (x, y) or (x, y, z) offset.
+        """
+        return self._deck_offset
+
+    @deck_offset.setter
+    def deck_offset(self, val) -> None:
+        """
+        Set the deck offset and drop the cached slot machine coordinates.
+        Args:
+            val: New (x, y) or (x, y, z) offset.
+        """
+        self._deck_offset = tuple(val)
+        self._machine_coord_cache = {}
+
     @property
     def safe_z(self) -> float:
         """
@@ -192,15 +268,13 @@ class Deck(SlotSet):
             Slot: The slot object.
         Raises:
             DeckStateError: If the slot does not exist.
-            DeckError: For unexpected errors.
         """
-        try:
-            return self.slots[str(slot_index)]
-        except KeyError:
+        # Keys are str; only non-str indices pay for the conversion
+        slots = self.slots
+        slot = slots.get(slot_index) if isinstance(slot_index, str) else slots.get(str(slot_index))
+        if slot is None:
             raise DeckStateError(f"Slot '{slot_index}' not found in deck.")
-        except Exception as e:
-            logger.error(f"Unexpected error when accessing slot '{slot_index}': {e}")
-            raise DeckError(f"Unexpected error when accessing slot '{slot_index}': {e}")
+        return slot
 
     def list_slots(self) -> list:
         """
@@ -208,7 +282,7 @@ class Deck(SlotSet):
         Returns:
             list: List of slot indices (as strings).
         """
-        return list(self.slots.keys())
+        return list(self._slot_keys)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # SLOT ACCESSORS & HELPERS
@@ -224,8 +298,7 @@ class Deck(SlotSet):
             DeckStateError: If the slot does not exist.
         """
         try:
-            slot = self.get_slot(slot_index)
-            return slot.__dict__
+            return _slot_info(self.get_slot(slot_index))
         except DeckStateError as e:
             logger.error(f"Error in get_slot_info: {e}")
             raise
@@ -296,7 +369,7 @@ class Deck(SlotSet):
             "offset": self.deck_offset,
             "material": self.material,
             "safe_z": self.safe_z,
-            "slots": {idx: self.get_slot_info(idx) for idx in self.list_slots()}
+            "slots": {idx: _slot_info(slot) for idx, slot in self.slots.items()}
         }
 
     # ═══════════════════════════════════════════════════════════════════════════
@@ -327,7 +400,7 @@ class Deck(SlotSet):
         slot_obj.has_labware = True
         slot_obj.labware = labware
         self.safe_z = getattr(labware, "dimensions", {}).get("zDimension", self.safe_z)
-        logger.info(f"Labware '{labware_filename}' loaded into slot {slot}.")
+        logger.info("Labware '%s' loaded into slot %s.", labware_filename, slot)
         return labware
 
     def change_labware(self, slot: str = None, labware_filename: str = None, path: Optional[str] = None, order: str = "rows") -> Labware:
@@ -348,7 +421,7 @@ class Deck(SlotSet):
             raise DeckEmptyError(f"No labware to unload in slot '{slot}'.")
         slot_obj.has_labware = False
         slot_obj.labware = None
-        logger.info(f"Labware unloaded from slot '{slot}'.")
+        logger.info("Labware unloaded from slot '%s'.", slot)
 
     def unload_all_labware(self) -> None:
         """
@@ -357,12 +430,11 @@ class Deck(SlotSet):
             DeckEmptyError: If no labware is loaded in any slot.
         """
         unloaded_any = False
-        for slot_index in self.list_slots():
-            slot_obj = self.get_slot(slot_index)
+        for slot_index, slot_obj in self.slots.items():
             if slot_obj.has_labware:
                 slot_obj.has_labware = False
                 slot_obj.labware = None
-                logger.info(f"Labware unloaded from slot '{slot_index}'.")
+                logger.info("Labware unloaded from slot '%s'.", slot_index)
                 unloaded_any = True
         if not unloaded_any:
             logger.warning("No labware to unload in any slot.")
@@ -397,13 +469,19 @@ class Deck(SlotSet):
         Raises:
             DeckStateError: If the slot does not exist.
         """
+        try:
+            return self._machine_coord_cache[slot_index]
+        except (KeyError, TypeError):
+            pass
         try:
             slot_coords = self.get_slot_coordinates(slot_index)
-            deck_offset = self.deck_offset
-            return (slot_coords[0] + deck_offset[0], slot_coords[1] + deck_offset[1])
         except DeckStateError as e:
             logger.error(f"Error in get_slot_machine_coordinates: {e}")
             raise
+        deck_offset = self._deck_offset
+        coords = (slot_coords[0] + deck_offset[0], slot_coords[1] + deck_offset[1])
+        self._machine_coord_cache[slot_index] = coords  # Cleared by the deck_offset setter
+        return coords
 
     def get_all_slot_machine_coordinates(self) -> dict:
         """
@@ -411,7 +489,8 @@ class Deck(SlotSet):
         Returns:
             dict: {slot_index: (x, y)} for each slot.
         """
-        return {idx: self.get_slot_machine_coordinates(idx) for idx in self.list_slots()}
+        ox, oy = self.deck_offset[:2]
+        return {idx: (slot.coordinates[0] + ox, slot.coordinates[1] + oy) for idx, slot in self.slots.items()}
 
     def get_well_machine_coordinates(self, slot_index: str, well_name: str) -> Optional[Tuple[float, float, float]]:
         """
@@ -427,7 +506,7 @@ class Deck(SlotSet):
         try:
             slot_obj = self.get_slot(slot_index)
             if not slot_obj.has_labware:
-                logger.warning(f"No labware loaded in slot '{slot_index}' for well '{well_name}'.")
+                logger.warning("No labware loaded in slot '%s' for well '%s'.", slot_index, well_name)
                 return None
             well_coords = slot_obj.labware.get_well_coordinates(well_name)
             slot_machine_coords = self.get_slot_machine_coordinates(slot_index)
@@ -445,19 +524,21 @@ class Deck(SlotSet):
         Returns:
             dict: {slot_index: {well_name: (x, y, z)}} for each loaded labware.
         """
+        # Single pass over the slots: deck offset read once, no per-well slot lookups
+        ox, oy = self.deck_offset[:2]
         all_coords = {}
-        for slot_index in self.list_slots():
-            try:
-                slot = self.get_slot(slot_index)
-                if slot.has_labware and slot.labware is not None:
-                    wells = {}
-                    for well_name in slot.labware.wells:
-                        coords = self.get_well_machine_coordinates(slot_index, well_name)
-                        if coords is not None:
-                            wells[well_name] = coords
-                    if wells:
-                        all_coords[slot_index] = wells
-            except DeckStateError as e:
-                logger.error(f"Error in get_all_well_machine_coordinates for slot '{slot_index}': {e}")
+        for slot_index, slot in self.slots.items():
+            labware = slot.labware
+            if not slot.has_labware or labware is None:
+                continue
+            sx, sy = slot.coordinates
+            bx, by = sx + ox, sy + oy
+            get_coords = labware.get_well_coordinates
+            wells = {}
+            for well_name in labware.wells:
+                wx, wy, wz = get_coords(well_name)
+                wells[well_name] = (bx + wx, by + wy, wz)
+            if wells:
+                all_coords[slot_index] = wells
         return all_coords
 
@@ -1,6 +1,16 @@
-import json
 import os
 
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 def input_float(prompt, default=None):
     val = input(f"{prompt} [{default}]: ")
     return float(val) if val else default
@@ -62,8 +72,8 @@ def create_deck_json():
         if overwrite not in ("y", "yes"): 
             print("Aborted: file not overwritten.")
             return
-    with open(full_path, "w", encoding="utf-8") as f:
-        json.dump(deck, f, indent=4, ensure_ascii=False)
+    with open(full_path, "wb") as f:
+        f.write(_dump_json(deck))
     print(f"\nDeck JSON created: {full_path}")
 
 if __name__ == "__main__":
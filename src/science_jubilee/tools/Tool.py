@@ -1,3 +1,5 @@
+from functools import wraps
+
 from science_jubilee.utils.exceptions import (ToolConfigurationError, ToolStateError)
 from science_jubilee.utils.logger_utils import setup_logging
 
@@ -12,6 +14,9 @@ class Tool:
     Provides a common interface and initialization for all tool types (pipette, camera, etc).
     Extend this class to implement custom tool logic.
     """
+    # Checked by requires_active_tool; the manager may set it per instance (default: unrestricted)
+    is_active_tool: bool = True
+
     # ───────────────────────────────────────────────────────────────────────────
     # INITIALIZATION
     # ───────────────────────────────────────────────────────────────────────────
@@ -31,12 +36,11 @@ class Tool:
         self.index = index
         self.name = name
         self._machine = None  # Optionally set by the manager when loaded
-        # Store any extra configuration for subclasses
-        
-        for k, v in kwargs.items():
-            setattr(self, k, v)
-            logger.debug(f"Set attribute {k}={v} for tool {self.name}")
-        logger.info(f"Tool '{self.name}' (index {self.index}) initialized.")
+        # Store any extra configuration for subclasses (plain attributes, so a bulk update is enough)
+        if kwargs:
+            self.__dict__.update(kwargs)
+            logger.debug("Set attributes %s for tool %s", kwargs, self.name)
+        logger.info("Tool '%s' (index %s) initialized.", self.name, self.index)
 
     # ───────────────────────────────────────────────────────────────────────────
     # MACHINE ATTACHMENT HOOKS
@@ -48,14 +52,14 @@ class Tool:
             machine: Reference to the parent machine/manager.
         """
         self._machine = machine
-        logger.debug(f"Tool '{self.name}' attached to machine.")
+        logger.debug("Tool '%s' attached to machine.", self.name)
 
     def detach_from_machine(self):
         """
         Called by the manager when the tool is unloaded from the machine.
         """
         self._machine = None
-        logger.debug(f"Tool '{self.name}' detached from machine.")
+        logger.debug("Tool '%s' detached from machine.", self.name)
 
     # ───────────────────────────────────────────────────────────────────────────
     # LIFECYCLE HOOKS FOR SUBCLASSES
@@ -65,7 +69,7 @@ class Tool:
         Optional hook for subclasses: called after the tool is loaded.
         Override in subclasses if needed.
         """
-        logger.debug(f"post_load called for tool {self.name}")
+        logger.debug("post_load called for tool %s", self.name)
         pass
 
     def pre_unload(self):
@@ -73,7 +77,7 @@ class Tool:
         Optional hook for subclasses: called before the tool is unloaded.
         Override in subclasses if needed.
         """
-        logger.debug(f"pre_unload called for tool {self.name}")
+        logger.debug("pre_unload called for tool %s", self.name)
         pass
 
     # ───────────────────────────────────────────────────────────────────────────
@@ -106,17 +110,16 @@ def requires_active_tool(func):
     Decorator to ensure that a tool cannot complete an action unless it is the current active tool.
     Raises ToolStateError if not active (requires manager to set is_active_tool if used).
     """
+    @wraps(func)
     def wrapper(self, *args, **kwargs):
-        if hasattr(self, 'is_active_tool') and not self.is_active_tool:
+        if not self.is_active_tool:
             logger.error(
                 f"Attempted to use inactive tool '{self.name}' for action '{func.__name__}'"
             )
             raise ToolStateError(
                 f"Error: Tool {self.name} is not the current `Active Tool`. Cannot perform this action"
             )
-        logger.debug(
-            f"Tool '{self.name}' is active. Proceeding with '{func.__name__}'"
-        )
+        logger.debug("Tool '%s' is active. Proceeding with '%s'", self.name, func.__name__)
         return func(self, *args, **kwargs)
     return wrapper
 
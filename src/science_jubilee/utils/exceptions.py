@@ -19,15 +19,34 @@ Example usage:
         logger.error(f"Deck error: {e}")
         raise JubileeManagerError("Deck operation failed") from e
 
+Where many error types need different handling (e.g. retry loops), `dispatch_error` maps exception
+classes to handlers with a dict lookup. Every exception also carries a stable string `code`
+(e.g. `DeckOccupiedError().code == "DECK_OCCUPIED"`), collected per class in `ERROR_CODE`.
+
 This structure ensures robust, modular, and maintainable error handling across the entire Jubilee automation codebase.
 """
+import re
+from typing import Any, Callable, Dict
+
+
+def _error_code(cls: type) -> str:
+    """Stable code derived from the class name, e.g. DeckOccupiedError -> 'DECK_OCCUPIED'."""
+    name = cls.__name__
+    if name.endswith("Error"):
+        name = name[:-len("Error")]
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", name).upper()
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BASE EXCEPTION (JUBILEE)
 # ═══════════════════════════════════════════════════════════════════════════════
 class JubileeError(Exception):
     """Base class for all exceptions in the Jubilee project."""
-    pass
+    code: str = "JUBILEE"  # Class-level, so branching on `err.code` needs no isinstance chain
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "code" not in cls.__dict__:
+            cls.code = _error_code(cls)
 
 # ============================================================================== 
 # JUBILEE MANAGER EXCEPTIONS
@@ -41,6 +60,7 @@ class JubileeManagerError(JubileeError):
 # ============================================================================== 
 class JubileeControllerError(JubileeError):
     """Base exception for all Jubilee controller errors."""
+
     def __init__(self, message=None, *, context=None):
         self.context = context
         full_message = f"{message}"
@@ -197,4 +217,47 @@ class ExperimentTimeoutError(ExperimentError):
 
 class ExperimentInterruptionError(ExperimentError):
     """Raised when an experiment is interrupted by the user or a critical error."""
-    pass
\ No newline at end of file
+    pass
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# ERROR CODES & DISPATCH
+# ═══════════════════════════════════════════════════════════════════════════════
+def _build_error_codes() -> Dict[type, str]:
+    codes = {}
+    pending = [JubileeError]
+    while pending:
+        cls = pending.pop()
+        if cls not in codes:
+            codes[cls] = cls.code
+            pending.extend(cls.__subclasses__())
+    return codes
+
+# Code of every exception class defined in this module, keyed by class
+ERROR_CODE: Dict[type, str] = _build_error_codes()
+
+
+def dispatch_error(exc: BaseException, handlers: Dict[type, Callable[[BaseException], Any]]) -> Any:
+    """
+    Call the handler registered for the exception's class, in place of a long `except` ladder:
+
+        handlers = {ToolCommunicationError: retry, DeckError: report}
+        try:
+            ...
+        except JubileeError as e:
+            dispatch_error(e, handlers)
+
+    The exact type is looked up first. Otherwise the MRO is walked once and the match is stored
+    back into `handlers` under the exact type, so later errors of that type are a single lookup.
+    Re-raises `exc` if no handler matches.
+    """
+    exc_type = type(exc)
+    handler = handlers.get(exc_type)
+    if handler is None:
+        for base in exc_type.__mro__[1:]:
+            handler = handlers.get(base)
+            if handler is not None:
+                handlers[exc_type] = handler
+                break
+        else:
+            raise exc
+    return handler(exc)
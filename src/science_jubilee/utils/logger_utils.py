@@ -1,37 +1,244 @@
+import atexit
+import functools
+import io
 import logging
 import os
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+# Log directories are resolved against this module's directory
+_PACKAGE_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Log directories already created by this process (shared by every log file in them)
+_ENSURED_DIRS: set = set()
 
 class AlignedNameFormatter(logging.Formatter):
-    def __init__(self, fmt=None, datefmt=None, maxlen=18):
-        super().__init__(fmt, datefmt)
+    """
+    Formats records as "asctime - [name]<padding> - levelname - message".
+    The layout is fixed and built directly in formatMessage rather than through a %-style fmt string.
+    """
+    def __init__(self, datefmt=None, maxlen=18):
+        super().__init__(datefmt=datefmt)
         self.maxlen = maxlen
+        self._pad_cache: dict = {}  # "[name]" + padding per logger name (a small, fixed set)
+        self._time_cache: tuple = (None, None, "")  # (second, datefmt, formatted) of the last record
 
     def format(self, record):
+        # The file and console handlers of a log file share this formatter: format each record once
+        cached = record.__dict__.get("_aligned_line")
+        if cached is not None and cached[0] is self:
+            return cached[1]
         name = record.name
-        spaces = ' ' * (self.maxlen - len(name))
-        record.spaces = spaces
-        return super().format(record)
+        padded_name = self._pad_cache.get(name)
+        if padded_name is None:
+            padded_name = self._pad_cache[name] = f"[{name}]" + ' ' * max(0, self.maxlen - len(name))
+        record.padded_name = padded_name
+        line = super().format(record)
+        record._aligned_line = (self, line)
+        return line
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            # The default format appends milliseconds, so it changes with every record
+            return super().formatTime(record, datefmt)
+        # Records logged in a burst share the same second: reuse its strftime result
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._time_cache = (second, datefmt, formatted)
+        return formatted
+
+    def usesTime(self):
+        # The fixed layout always includes asctime
+        return True
+
+    def formatMessage(self, record):
+        return f"{record.asctime} - {record.padded_name} - {record.levelname} - {record.message}"
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler writing through a 64 KiB buffer instead of flushing after every record.
+    The buffer is flushed on WARNING and above, and when the handler is closed (logging shutdown).
+    """
+    buffer_size = 65536
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def flush(self):
+        # StreamHandler.emit() calls this after every record: leave the data in the buffer
+        pass
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            logging.StreamHandler.flush(self)
+
+    def close(self):
+        logging.StreamHandler.flush(self)
+        super().close()
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler for a redirected console (CI, nohup, systemd): records are collected and written in
+    one call once 64 KiB are pending, on WARNING and above, and on flush/close (logging shutdown).
+    """
+    buffer_size = 65536
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._pending: list = []
+        self._pending_size = 0
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            self._pending.append(msg)
+            self._pending_size += len(msg)
+            if record.levelno >= logging.WARNING or self._pending_size >= self.buffer_size:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._pending:
+                self.stream.write("".join(self._pending))
+                self._pending.clear()
+                self._pending_size = 0
+        finally:
+            self.release()
+        super().flush()
+
+    def close(self):
+        self.flush()
+        super().close()
+
+def _level_number(level) -> int:
+    """Return a level given as a number or a name (e.g. "DEBUG") as a number; None means NOTSET."""
+    if level is None:
+        return logging.NOTSET
+    return level if isinstance(level, int) else logging.getLevelName(level)
+
+class _TargetLevelFilter(logging.Filter):
+    """
+    Filter for a shared file or console handler: drops records below the minimum level that the
+    emitting logger set for this target. _LevelTaggingQueueHandler stores that level on the record.
+    """
+    def __init__(self, attr):
+        super().__init__()
+        self.attr = attr
+
+    def filter(self, record):
+        return record.levelno >= getattr(record, self.attr, logging.NOTSET)
+
+class _LevelTaggingQueueHandler(QueueHandler):
+    """
+    QueueHandler that tags each record with its logger's file and console levels, so loggers sharing
+    a log file (and therefore its handlers) can each have their own levels.
+    """
+    def __init__(self, queue, file_level=None, console_level=None):
+        super().__init__(queue)
+        self.file_level = _level_number(file_level)
+        self.console_level = _level_number(console_level)
+
+    def prepare(self, record):
+        record = super().prepare(record)
+        record._file_level = self.file_level
+        record._console_level = self.console_level
+        return record
+
+def _stderr_is_redirected() -> bool:
+    """True when stderr is a real stream that is not a terminal (notebook output streams are not batched)."""
+    try:
+        return isinstance(sys.stderr, io.TextIOWrapper) and not sys.stderr.isatty()
+    except ValueError:  # closed stream
+        return False
+
+# One queue + listener thread per log file, shared by every logger writing to it
+_log_queues: dict = {}
+_log_queues_lock = threading.Lock()
+
+def _get_log_queue(full_path: str) -> tuple:
+    """
+    Return (queue, (file_handler, console_handler)) for full_path, starting its listener on first use.
+    The listener thread does the actual I/O; it is stopped (and drained) at interpreter exit.
+    """
+    with _log_queues_lock:
+        entry = _log_queues.get(full_path)
+        if entry is not None:
+            return entry
+
+        file_handler = BufferedFileHandler(full_path, mode='a', encoding='utf-8')
+        console_handler = BufferedStreamHandler() if _stderr_is_redirected() else logging.StreamHandler()
+
+        formatter = AlignedNameFormatter(
+            datefmt='%Y-%m-%d %H:%M:%S',
+            maxlen=18 # Adjust this value to change the alignment width
+        )
+
+        file_handler.setFormatter(formatter)
+        console_handler.setFormatter(formatter)
+        file_handler.addFilter(_TargetLevelFilter("_file_level"))
+        console_handler.addFilter(_TargetLevelFilter("_console_level"))
+
+        queue = SimpleQueue()
+        listener = QueueListener(queue, file_handler, console_handler, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        entry = _log_queues[full_path] = (queue, (file_handler, console_handler))
+        return entry
+
+@functools.lru_cache(maxsize=None)
+def _resolve_log_path(log_dir: str, log_file: str) -> str:
+    """Create the log directory on first use and return the full log file path. Memoized."""
+    log_dir_abs = os.path.join(_PACKAGE_ROOT, log_dir)
+    if log_dir_abs not in _ENSURED_DIRS:
+        os.makedirs(log_dir_abs, exist_ok=True)
+        _ENSURED_DIRS.add(log_dir_abs)
+    return os.path.join(log_dir_abs, log_file)
+
+def _find_caller_without_frames(logger, stack_info=False, stacklevel=1):
+    """
+    findCaller replacement for loggers from setup_logging: their layout never shows the caller's
+    file, line or function, so the frame walk done for every record is skipped.
+    Records logged with stack_info=True still get the real lookup.
+    """
+    if stack_info:
+        # +1 skips this wrapper's own frame
+        return logging.Logger.findCaller(logger, stack_info, stacklevel + 1)
+    return "(unknown file)", 0, "(unknown function)", None
 
 def setup_logging(
     log_dir="logs",
     log_file="jubilee.log",
     level=logging.INFO,
     logger_name=None,
+    file_level=None,
+    console_level=None,
 ) -> logging.Logger:
     """
     Configure and return a named logger.
+    Records are handed to a queue; a background listener writes them to the log file and the console.
 
     :param log_dir: Directory (relative to the science_jubilee package) where logs will be saved.
     :param log_file: Name of the log file.
     :param level: Logging level (e.g., logging.INFO).
     :param logger_name: Optional name for the logger.
-    :return: Configured logger instance.
+    :param file_level: Optional minimum level of this logger's records written to the log file.
+    :param console_level: Optional minimum level of this logger's records printed to the console.
+    :return: Configured logger instance. Its records do not carry the caller's pathname, lineno or funcName;
+        delete the logger's `findCaller` attribute to restore them.
     """
-    # Always place the logs directory inside the science_jubilee package root
-    package_root = os.path.dirname(os.path.abspath(__file__))
-    log_dir_abs = os.path.join(package_root, log_dir)
-    os.makedirs(log_dir_abs, exist_ok=True)
-    full_path = os.path.join(log_dir_abs, log_file)
+    # Always place the logs directory inside the package root; no filesystem access after the first call
+    full_path = _resolve_log_path(log_dir, log_file)
+
+    queue, _ = _get_log_queue(full_path)
 
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
@@ -40,20 +247,8 @@ def setup_logging(
     if logger.hasHandlers():
         logger.handlers.clear()
 
-    file_handler = logging.FileHandler(full_path, mode='a', encoding='utf-8')
-    console_handler = logging.StreamHandler()
-
-    formatter = AlignedNameFormatter(
-        "%(asctime)s - [%(name)s]%(spaces)s - %(levelname)s - %(message)s",
-        datefmt='%Y-%m-%d %H:%M:%S',
-        maxlen=18 # Adjust this value to change the alignment width
-    )
-
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    logger.addHandler(_LevelTaggingQueueHandler(queue, file_level, console_level))
     logger.propagate = False
+    logger.findCaller = functools.partial(_find_caller_without_frames, logger)
 
-    return logger
\ No newline at end of file
+    return logger
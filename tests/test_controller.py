@@ -0,0 +1,236 @@
+import json
+from http.client import RemoteDisconnected
+
+import numpy as np
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from science_jubilee.JubileeController import JubileeController
+from science_jubilee.utils.exceptions import JubileeCommunicationError, JubileeConfigurationError, JubileeStateError
+
+AXES = [
+    {"letter": "X", "min": 0, "max": 300},
+    {"letter": "Y", "min": 0, "max": 400},
+    {"letter": "Z", "min": 0, "max": 300},
+    {"letter": "U", "min": 0, "max": 200},
+]
+
+
+class FakeResponse:
+    def __init__(self, content=b"", status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+
+class FakeSession:
+    """Stands in for the DSF /machine/code endpoint and records every G-code block sent."""
+
+    def __init__(self, replies=None, send_error=None):
+        self.sent = []
+        self.legacy = []
+        self.replies = replies or {}
+        self.send_error = send_error
+
+    def prepare_request(self, request):
+        return requests.Session().prepare_request(request)
+
+    def send(self, request, timeout=None):
+        if self.send_error is not None:
+            raise self.send_error
+        body = request.body.decode()
+        self.sent.append(body)
+        if body == 'M409 K"move.axes"':
+            return FakeResponse(json.dumps({"result": AXES}).encode())
+        if body == 'M409 K"move.axes[].userPosition"':
+            return FakeResponse(b'{"result": [0.0, 0.0, 0.0, 0.0]}')
+        for marker, reply in self.replies.items():
+            if marker in body:
+                return FakeResponse(reply)
+        return FakeResponse()
+
+    def get(self, url, timeout=None):
+        self.legacy.append(url)
+        if "rr_model" in url:
+            return FakeResponse(json.dumps({"result": len(self.legacy)}).encode())
+        return FakeResponse(b"legacy reply")
+
+
+def connected(session=None):
+    """A homed controller in absolute mode, talking to a FakeSession."""
+    controller = JubileeController(simulated=True)
+    controller.simulated = False
+    controller.session = session or FakeSession()
+    controller.axes_homed = [True, True, True, True]
+    controller._absolute_positioning = True
+    return controller
+
+
+def moves(controller):
+    return [body for body in controller.session.sent if not body.startswith("M409")]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# G-CODE BATCHES
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_gcode_batch_sends_one_block():
+    controller = connected()
+    controller.gcode_batch(["G28 X", "", "G28 Y"])
+    assert controller.session.sent == ["G28 X\nG28 Y"]
+
+
+def test_gcode_batch_without_commands_sends_nothing():
+    controller = connected()
+    assert controller.gcode_batch(["", ""]) == ""
+    assert controller.session.sent == []
+
+
+def test_timeout_is_not_resent_through_rr_gcode():
+    controller = connected(FakeSession(send_error=requests.ReadTimeout("read timed out")))
+    with pytest.raises(JubileeCommunicationError):
+        controller.gcode("G0 X10")
+    assert controller.session.legacy == []
+    assert controller._machine_code_supported is None
+
+
+def test_connection_refused_falls_back_to_rr_gcode():
+    refused = NewConnectionError(None, "Connection refused")
+    error = requests.ConnectionError(MaxRetryError(None, "/machine/code", refused))
+    controller = connected(FakeSession(send_error=error))
+    assert controller.gcode("M400") == "legacy reply"
+    assert controller._machine_code_supported is False
+
+
+def test_connection_aborted_after_send_is_not_resent():
+    aborted = ProtocolError("Connection aborted.", RemoteDisconnected("closed"))
+    controller = connected(FakeSession(send_error=requests.ConnectionError(aborted)))
+    with pytest.raises(JubileeCommunicationError):
+        controller.gcode("G0 X10")
+    assert controller.session.legacy == []
+    assert controller._machine_code_supported is None
+
+
+def test_rr_gcode_requests_are_not_retried():
+    session = JubileeController._session_for("192.0.2.1")
+    assert session.get_adapter("http://192.0.2.1/rr_gcode?gcode=G91").max_retries.total == 0
+    assert session.get_adapter("http://192.0.2.1/rr_reply").max_retries.total == 5
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MOVES
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_move_to_repeats_every_word_of_the_previous_move():
+    # The machine may have been jogged in between: separate moves never rely on earlier words
+    controller = connected()
+    controller.move_to(x=10, y=20, z=30)
+    controller.move_to(x=15, y=20, z=30)
+    assert moves(controller) == ["G0 X10.00 Y20.00 Z30.00 F6000.00", "G0 X15.00 Y20.00 Z30.00 F6000.00"]
+
+
+def test_move_to_restores_absolute_mode_after_raw_g91():
+    controller = connected()
+    controller.move_to(x=10, y=20)
+    controller.gcode("G91")
+    controller.move_to(x=10, y=20)
+    assert moves(controller)[-1] == "G90\nG0 X10.00 Y20.00 F6000.00"
+
+
+def test_relative_move_switches_mode_once():
+    controller = connected()
+    controller.move(dx=1)
+    controller.move(dx=1)
+    sent = moves(controller)
+    assert sent[0].startswith("G91\n")
+    assert not sent[1].startswith("G91")
+
+
+def test_move_to_many_sends_one_batch():
+    controller = connected()
+    controller.move_to_many([[10, 20, 30], [40, 50, 60]], wait=True)
+    assert moves(controller) == ["G0 X10.00 Y20.00 Z30.00 F6000.00\nG0 X40.00 Y50.00 Z60.00\nM400"]
+
+
+def test_move_to_many_leaves_out_repeated_words():
+    controller = connected()
+    controller.move_to_many([[10, 20, 30], [15, 20, 30], [15, 20, 30], [15, 25, 35]])
+    assert moves(controller) == ["G0 X10.00 Y20.00 Z30.00 F6000.00\nG0 X15.00\nG0 Y25.00 Z35.00"]
+
+
+def test_move_to_many_rejects_bad_waypoints():
+    controller = connected()
+    with pytest.raises(JubileeConfigurationError):
+        controller.move_to_many([1, 2, 3])
+    with pytest.raises(JubileeStateError, match="waypoint 1"):
+        controller.move_to_many([[10, 20, 30], [10, 500, 30]])
+    assert moves(controller) == []
+
+
+def test_move_to_many_rejects_nan_waypoints():
+    controller = connected()
+    with pytest.raises(JubileeStateError, match="Z axis limit .* waypoint 0"):
+        controller.move_to_many([[10, 20, float("nan")]])
+    assert moves(controller) == []
+
+
+def test_sync_calls_wait_for_queued_async_moves():
+    controller = connected()
+    futures = [controller.move_to_async(x=10 + i, y=20) for i in range(3)]
+    controller.gcode("M400")
+    for future in futures:
+        future.result()
+    assert moves(controller) == ["G0 X10.00 Y20.00 F6000.00", "G0 X11.00 Y20.00 F6000.00", "G0 X12.00 Y20.00 F6000.00", "M400"]
+    controller.disconnect()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOOL CHANGES
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_set_tool_parking_positions_rebuilds_lookup_tables():
+    controller = JubileeController(simulated=True)
+    controller.set_tool_parking_positions({5: {"x_park": 10.0, "y_clear": 20.0, "y_park": 30.0, "z_park": 40.0}})
+    assert controller._parking_tuples == {5: (10.0, 20.0, 30.0, 40.0)}
+    assert controller._park_rows == {5: 0}
+    assert controller._park_gcode[5] == ("G0 X10.00 Y20.00 Z40.00 F6000.00", "G0 Y30.00", "G0 Y20.00 F6000.00")
+    with pytest.raises(JubileeConfigurationError):
+        controller.set_tool_parking_positions({0: {"x_park": 1.0}})
+
+
+def test_plan_tool_changes_returns_approach_dock_retract():
+    controller = JubileeController(simulated=True)
+    waypoints = controller.plan_tool_changes([1, 0])
+    assert waypoints.shape == (6, 3)
+    np.testing.assert_allclose(waypoints[:3], [[191, 280, 150], [191, 342, 150], [191, 280, 150]])
+    np.testing.assert_allclose(waypoints[3:, 0], 277)
+    with pytest.raises(JubileeStateError):
+        controller.plan_tool_changes([9])
+
+
+def test_tool_change_waits_for_dock_before_macro():
+    controller = connected()
+    controller.pickup_tool_sequence(1)
+    lines = moves(controller)[0].splitlines()
+    macro = lines.index('M98 P"0:/macros/tool_manager/tool_lock.g"')
+    assert lines[macro - 1] == "M400"
+    assert lines[macro + 1] == "G90"
+    assert lines[-1] == "M400"
+
+
+def test_tool_change_always_sends_the_approach():
+    controller = connected()
+    controller.move_to(x=191, y=280, z=150)
+    controller.pickup_tool_sequence(1)
+    assert moves(controller)[-1].startswith("G0 X191.00 Y280.00 Z150.00 F6000.00\nG0 Y342.00\n")
+
+
+def test_move_after_tool_change_sends_every_word():
+    controller = connected()
+    controller.move_to(x=191, y=280, z=150)
+    controller.pickup_tool_sequence(1)
+    controller.move_to(x=191, y=280, z=150)
+    assert moves(controller)[-1] == "G0 X191.00 Y280.00 Z150.00 F6000.00"
+
+
+def test_tool_change_error_is_raised():
+    controller = connected(FakeSession(replies={"M98": b"Error: tool_lock.g: lock failed"}))
+    with pytest.raises(JubileeStateError, match="lock failed"):
+        controller.park_tool_sequence(0)
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from science_jubilee.decks.Deck import Deck
+from science_jubilee.utils.exceptions import DeckConfigurationError
+
+
+def write_deck(tmp_path, slots, deck_offset=(0.0, 0.0)):
+    config = {"name": "TestDeck", "deck_offset": list(deck_offset), "slots": slots}
+    (tmp_path / "test_deck.json").write_text(json.dumps(config))
+    return Deck("test_deck", str(tmp_path))
+
+
+def rectangle(x, y):
+    return {"coordinates": [x, y], "shape": "rectangle", "width": 127.0, "length": 85.0, "has_labware": False, "labware": None}
+
+
+def test_all_well_coordinates_match_single_well_lookups(tmp_path):
+    deck = write_deck(tmp_path, {"0": rectangle(8.5, 12.5), "1": rectangle(150.0, 12.5), "2": rectangle(8.5, 150.0)},
+                      deck_offset=(3.0, -2.0, 1.0))
+    deck.load_labware("0", "agilent_1_reservoir_290ml")
+    deck.load_labware("1", "20mlscintillation_12_wellplate_18000ul")
+
+    all_coords = deck.get_all_well_machine_coordinates()
+
+    assert set(all_coords) == {"0", "1"}
+    for slot_index, wells in all_coords.items():
+        for well_name, xyz in wells.items():
+            assert xyz == pytest.approx(deck.get_well_machine_coordinates(slot_index, well_name))
+
+
+def test_invalid_slots_are_reported_together(tmp_path):
+    slots = {
+        "0": rectangle(8.5, 12.5),
+        "1": {"shape": "rectangle", "width": 1.0, "length": 1.0},
+        "2": {"coordinates": [0.0, 0.0], "shape": "circle"},
+        "3": "not an object",
+    }
+    with pytest.raises(DeckConfigurationError) as excinfo:
+        write_deck(tmp_path, slots)
+    message = str(excinfo.value)
+    assert "'1' missing 'coordinates'" in message
+    assert "'2' missing 'diameter'" in message
+    assert "slot '3'" in message
+    assert "slot '0'" not in message
+
+
+def test_decks_from_the_same_file_do_not_share_config(tmp_path):
+    first = write_deck(tmp_path, {"0": rectangle(8.5, 12.5)})
+    first.deck_config["slots"]["0"]["coordinates"][0] = 99.0
+    second = Deck("test_deck", str(tmp_path))
+    assert second.deck_config["slots"]["0"]["coordinates"] == [8.5, 12.5]
+
+
+def test_all_slot_coordinates_are_plain_floats(tmp_path):
+    deck = write_deck(tmp_path, {"0": rectangle(8.5, 12.5), "1": rectangle(150.0, 12.5)}, deck_offset=(3.0, -2.0))
+    coords = deck.get_all_slot_machine_coordinates()
+    assert coords == {"0": (11.5, 10.5), "1": (153.0, 10.5)}
+    assert all(type(value) is float for xy in coords.values() for value in xy)
+
+
+def test_summary_is_json_serializable(tmp_path):
+    deck = write_deck(tmp_path, {"0": rectangle(8.5, 12.5)}, deck_offset=(3.0, -2.0))
+    summary = json.loads(json.dumps(deck.get_summary()))
+    assert summary["slots"]["0"]["coordinates"] == [8.5, 12.5]
+    assert summary["slots"]["0"]["has_labware"] is False
@@ -0,0 +1,64 @@
+import pickle
+
+import pytest
+
+from science_jubilee.utils.exceptions import (
+    ERROR_CODE,
+    DeckError,
+    DeckOccupiedError,
+    DeckStateError,
+    JubileeError,
+    JubileeHomingError,
+    ToolCommunicationError,
+    ToolError,
+    UIInputError,
+    dispatch_error,
+)
+
+
+def test_error_codes_follow_class_names():
+    assert DeckOccupiedError.code == "DECK_OCCUPIED"
+    assert JubileeHomingError("m").code == "JUBILEE_HOMING"
+    assert UIInputError.code == "UI_INPUT"
+    assert JubileeError.code == "JUBILEE"
+
+
+def test_error_code_table_covers_the_hierarchy():
+    pending = [JubileeError]
+    while pending:
+        cls = pending.pop()
+        if cls.__module__ == JubileeError.__module__:  # Skip subclasses defined by other tests
+            assert ERROR_CODE[cls] == cls.code
+        pending.extend(cls.__subclasses__())
+    assert len(set(ERROR_CODE.values())) == len(ERROR_CODE)
+
+
+def test_explicit_code_is_kept():
+    class CustomDeckError(DeckError):
+        code = "CUSTOM"
+
+    assert CustomDeckError().code == "CUSTOM"
+
+
+def test_dispatch_error_resolves_through_the_mro():
+    handlers = {DeckError: lambda e: "deck", ToolCommunicationError: lambda e: "retry"}
+    assert dispatch_error(DeckOccupiedError("full"), handlers) == "deck"
+    # The MRO match is memoized under the exact type
+    assert handlers[DeckOccupiedError] is handlers[DeckError]
+    assert dispatch_error(ToolCommunicationError("lost"), handlers) == "retry"
+
+
+def test_dispatch_error_prefers_the_most_specific_handler():
+    handlers = {DeckError: lambda e: "deck", DeckStateError: lambda e: "state"}
+    assert dispatch_error(DeckOccupiedError("full"), handlers) == "state"
+
+
+def test_dispatch_error_reraises_unhandled():
+    with pytest.raises(ToolError):
+        dispatch_error(ToolError("no handler"), {DeckError: lambda e: None})
+
+
+def test_controller_error_context_survives_pickling():
+    err = pickle.loads(pickle.dumps(JubileeHomingError("homing failed", context={"axis": "Z"})))
+    assert err.context == {"axis": "Z"}
+    assert "homing failed" in str(err)
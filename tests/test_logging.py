@@ -0,0 +1,31 @@
+import logging
+import os
+
+from science_jubilee.utils.logger_utils import AlignedNameFormatter, _get_log_queue, setup_logging
+
+
+def routed(logger, level, handlers):
+    """Return whether a record of this level from this logger passes the file and console handlers."""
+    record = logger.handlers[0].prepare(logger.makeRecord(logger.name, level, __file__, 0, "message", (), None))
+    return tuple(bool(handler.filter(record)) for handler in handlers)
+
+
+def test_target_levels_are_per_logger(tmp_path):
+    quiet = setup_logging(str(tmp_path), "test.log", logger_name="test.quiet",
+                          file_level=logging.WARNING, console_level="ERROR")
+    chatty = setup_logging(str(tmp_path), "test.log", logger_name="test.chatty", level=logging.DEBUG)
+    _, handlers = _get_log_queue(os.path.join(str(tmp_path), "test.log"))
+
+    assert routed(quiet, logging.INFO, handlers) == (False, False)
+    assert routed(quiet, logging.WARNING, handlers) == (True, False)
+    assert routed(quiet, logging.ERROR, handlers) == (True, True)
+    assert routed(chatty, logging.DEBUG, handlers) == (True, True)
+    assert all(handler.level == logging.NOTSET for handler in handlers)
+
+
+def test_aligned_name_formatter_pads_the_logger_name():
+    formatter = AlignedNameFormatter(datefmt="%Y", maxlen=8)
+    record = logging.LogRecord("Deck", logging.INFO, __file__, 0, "loaded %s", ("slot",), None)
+    line = formatter.format(record)
+    assert line.endswith(" - [Deck]     - INFO - loaded slot")
+    assert formatter.format(record) is line
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from science_jubilee.JubileeController import JubileeController
+from science_jubilee.JubileeManager import JubileeManager
+from science_jubilee.tools.Tool import Tool
+from science_jubilee.utils.exceptions import ToolStateError
+
+
+def manager_with_tools(*names):
+    manager = JubileeManager(controller=JubileeController(simulated=True), simulated=True)
+    for index, name in enumerate(names):
+        manager.load_tool(Tool(index, name), index)
+    return manager
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# STATUS
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_status_returns_plain_containers():
+    manager = manager_with_tools("pipette")
+    status = manager.status()
+    assert status == {
+        "deck": None,
+        "tools": [{"index": 0, "name": "pipette"}],
+        "active_tool_index": None,
+        "active_tool_name": None,
+        "tool_offsets": {},
+    }
+    status["tools"].append({"index": 1, "name": "camera"})
+    status["tool_offsets"][0] = (1.0, 2.0, 3.0)
+    assert manager.status()["tools"] == [{"index": 0, "name": "pipette"}]
+    assert manager.status()["tool_offsets"] == {}
+
+
+def test_status_follows_direct_attribute_writes():
+    manager = manager_with_tools("pipette")
+    manager.status()
+    manager.active_tool_index = 0
+    assert manager.status()["active_tool_name"] == "pipette"
+    manager.tool_offsets[0] = (1.0, 2.0, 3.0)
+    assert manager.status()["tool_offsets"] == {0: (1.0, 2.0, 3.0)}
+    manager.tool_offsets = {}
+    assert manager.status()["tool_offsets"] == {}
+    manager.tool_offsets[0] = (4.0, 5.0, 6.0)
+    assert manager.status()["tool_offsets"] == {0: (4.0, 5.0, 6.0)}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOOL LOOKUP
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_renamed_tool_is_found_by_its_new_name():
+    manager = manager_with_tools("pipette", "camera")
+    manager.tools_list[0].name = "syringe"
+    assert manager.get_tool_by_name("syringe")["index"] == 0
+    manager.set_active_tool_by_name("syringe")
+    assert manager.active_tool_index == 0
+    with pytest.raises(ToolStateError):
+        manager.get_tool_by_name("pipette")
+    with pytest.raises(ToolStateError):
+        manager.load_tool(Tool(2, "syringe"), 2)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TOOL PARKING
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_parking_z_follows_deck_and_tool_offsets(tmp_path):
+    config = {"name": "TestDeck", "deck_offset": [0.0, 0.0, 2.0], "slots": {}}
+    (tmp_path / "test_deck.json").write_text(json.dumps(config))
+    manager = manager_with_tools("pipette")
+    manager.load_deck("test_deck", str(tmp_path))
+    manager.set_tool_offset(0, (0.0, 0.0, 10.0))
+    assert manager._compute_z_park(0) == 12.0
+    manager.deck.deck_offset = (0.0, 0.0, 5.0)
+    assert manager._compute_z_park(0) == 15.0
+    manager.tool_offsets[0] = (0.0, 0.0, 20.0)
+    assert manager._compute_z_park(0) == 25.0
+    manager.unload_deck()
+    assert manager._compute_z_park(0) == 20.0
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# WELL POSITIONS
+# ═══════════════════════════════════════════════════════════════════════════════
+def test_well_position_uses_the_current_deck_z(tmp_path):
+    slot = {"coordinates": [10.0, 20.0], "shape": "rectangle", "width": 127.0, "length": 85.0}
+    config = {"name": "TestDeck", "deck_offset": [1.0, 2.0, 3.0], "slots": {"0": slot}}
+    (tmp_path / "test_deck.json").write_text(json.dumps(config))
+    manager = manager_with_tools()
+    manager.load_deck("test_deck", str(tmp_path))
+    manager.deck.load_labware("0", "agilent_1_reservoir_290ml")
+    wx, wy, wz = manager.deck.slots["0"].labware.get_well_coordinates("A1")
+    manager.deck.deck_offset = (1.0, 2.0, 7.0)
+    assert manager._well_machine_xyz("0", "A1") == (11.0 + wx, 22.0 + wy, 7.0 + wz)